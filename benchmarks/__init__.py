@@ -0,0 +1,8 @@
+"""Benchmarks for data2rdf with synthetic data.
+
+Run the suite with `python -m benchmarks`. See `python -m benchmarks --help`
+for selecting scenarios and the size of the generated inputs."""
+
+import os
+
+QUDT_UNITS = os.path.join(os.path.dirname(__file__), "qudt_units.ttl")
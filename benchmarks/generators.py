@@ -0,0 +1,385 @@
+"""Generators for synthetic benchmark inputs"""
+
+import json
+import os
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+
+BASE_IRI = "https://www.example.org/benchmark/"
+UNITS = ["mm", "s", "N", "MPa", "°C", "mm/s"]
+
+TBOX_COLUMNS = {
+    "Label": (
+        "http://www.w3.org/2000/01/rdf-schema#label",
+        "annotation_property",
+    ),
+    "Description": (
+        "http://purl.org/dc/terms/description",
+        "data_property",
+    ),
+    "Unit": (
+        "https://www.example.org/benchmark/hasTypicalUnit",
+        "data_property",
+    ),
+    "Parent": (
+        "http://www.w3.org/2000/01/rdf-schema#subClassOf",
+        "object_property",
+    ),
+}
+
+
+@dataclass
+class SyntheticInput:
+    """Generated input for a single benchmark scenario"""
+
+    parser: str
+    mode: str
+    raw_data: Union[str, Dict[str, Any], List[Dict[str, Any]]]
+    mapping: List[Dict[str, Any]]
+    parser_args: Dict[str, Any] = field(default_factory=dict)
+    rows: int = 0
+    size: int = 0
+
+
+def _unit(n: int) -> str:
+    return UNITS[n % len(UNITS)]
+
+
+def _metadata_value(n: int, rng: random.Random) -> Union[str, float]:
+    """Every second metadatum is a quantity, the others are plain strings"""
+    if n % 2:
+        return round(rng.uniform(0, 1000), 3)
+    return f"value_{n}"
+
+
+def make_csv_abox(
+    directory: str,
+    metadata_rows: int = 20,
+    columns: int = 6,
+    rows: int = 1000,
+    sep: str = "\t",
+    header_length: int = 2,
+    mapped_columns: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    engine: str = "c",
+    seed: int = 42,
+) -> SyntheticInput:
+    """Write a CSV file with a metadata block and a dataframe.
+    Optionally, only the first `mapped_columns` columns of the dataframe
+    are included in the mapping and the dataframe is read in chunks or
+    with another engine of pandas."""
+    rng = random.Random(seed)
+    lines = []
+    mapping = []
+    for n in range(metadata_rows):
+        value = _metadata_value(n, rng)
+        if isinstance(value, float):
+            lines.append(f'"Param{n}"{sep}{value}{sep}"{_unit(n)}"')
+        else:
+            lines.append(f'"Param{n}"{sep}"{value}"')
+        mapping.append({"key": f"Param{n}", "iri": f"{BASE_IRI}Parameter{n}"})
+    lines.append(sep.join(f'"Column{n}"' for n in range(columns)))
+    if header_length == 2:
+        lines.append(sep.join(f'"{_unit(n)}"' for n in range(columns)))
+    for _ in range(rows):
+        lines.append(sep.join(str(rng.random()) for _ in range(columns)))
+    for n in range(columns if mapped_columns is None else mapped_columns):
+        mapping.append({"key": f"Column{n}", "iri": f"{BASE_IRI}Column{n}"})
+
+    parser_args = {
+        "metadata_sep": sep,
+        "dataframe_sep": sep,
+        "metadata_length": metadata_rows,
+        "dataframe_header_length": header_length,
+    }
+    if chunksize:
+        parser_args["chunksize"] = chunksize
+    if engine != "c":
+        parser_args["engine"] = engine
+
+    path = os.path.join(directory, "abox.csv")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+    return SyntheticInput(
+        parser="csv",
+        mode="abox",
+        raw_data=path,
+        mapping=mapping,
+        parser_args=parser_args,
+        rows=rows,
+        size=os.path.getsize(path),
+    )
+
+
+def make_excel_abox(
+    directory: str,
+    metadata_rows: int = 20,
+    columns: int = 6,
+    rows: int = 1000,
+    extra_sheets: int = 0,
+    data_sheets: int = 1,
+    read_only: bool = False,
+    max_workers: int = 1,
+    engine: str = "openpyxl",
+    seed: int = 42,
+) -> SyntheticInput:
+    """Write an excel workbook with a metadata sheet and a dataframe sheet.
+    Optionally, additional sheets which are not referenced by the mapping
+    and filled with the same dataframe are added. The columns of the
+    dataframe may be spread over multiple sheets referenced by the mapping,
+    which are parsed in `max_workers` processes. The workbook may be
+    streamed by the parser in read-only mode or read with another reader
+    of the parser."""
+    rng = random.Random(seed)
+    workbook = Workbook()
+    metadata = workbook.active
+    metadata.title = "Metadata"
+    mapping = []
+    for n in range(metadata_rows):
+        value = _metadata_value(n, rng)
+        row = n + 1
+        metadata.cell(row=row, column=1, value=f"Param{n}")
+        metadata.cell(row=row, column=2, value=value)
+        datum = {
+            "key": f"Param{n}",
+            "iri": f"{BASE_IRI}Parameter{n}",
+            "worksheet": "Metadata",
+            "value_location": f"B{row}",
+        }
+        if isinstance(value, float):
+            metadata.cell(row=row, column=3, value=_unit(n))
+            datum["unit_location"] = f"C{row}"
+        mapping.append(datum)
+
+    data = [[rng.random() for _ in range(columns)] for _ in range(rows)]
+    titles = ["Data"]
+    titles += [f"Data{number}" for number in range(2, data_sheets + 1)]
+    unused = [f"Unused{number + 1}" for number in range(extra_sheets)]
+    for title in titles + unused:
+        worksheet = workbook.create_sheet(title)
+        worksheet.append([f"Column{n}" for n in range(columns)])
+        worksheet.append([_unit(n) for n in range(columns)])
+        for values in data:
+            worksheet.append(values)
+    for n in range(columns):
+        letter = get_column_letter(n + 1)
+        mapping.append(
+            {
+                "key": f"Column{n}",
+                "iri": f"{BASE_IRI}Column{n}",
+                "worksheet": titles[n % data_sheets],
+                "dataframe_start": f"{letter}3",
+                "unit_location": f"{letter}2",
+            }
+        )
+
+    parser_args = {}
+    if read_only:
+        parser_args["read_only"] = read_only
+    if max_workers > 1:
+        parser_args["max_workers"] = max_workers
+    if engine != "openpyxl":
+        parser_args["engine"] = engine
+
+    path = os.path.join(directory, "abox.xlsx")
+    workbook.save(path)
+    return SyntheticInput(
+        parser="excel",
+        mode="abox",
+        raw_data=path,
+        mapping=mapping,
+        rows=rows,
+        size=os.path.getsize(path),
+        parser_args=parser_args,
+    )
+
+
+def make_json_abox(
+    directory: str,
+    metadata_items: int = 20,
+    nesting: int = 3,
+    arrays: int = 6,
+    array_length: int = 1000,
+    expand_array: bool = False,
+    source_items: int = 0,
+    unmapped_arrays: int = 0,
+    streaming: bool = False,
+    seed: int = 42,
+) -> SyntheticInput:
+    """Write a json file with nested metadata and arrays of numbers.
+    Optionally, a list of objects is added, which is mapped with custom
+    relations for each of its objects, as well as arrays of numbers which
+    are not referenced by the mapping."""
+    rng = random.Random(seed)
+    document = {"metadata": {}, "data": {}}
+    mapping = []
+    for n in range(metadata_items):
+        levels = [f"level{depth}" for depth in range(n % (nesting + 1))]
+        node = document["metadata"]
+        for level in levels:
+            node = node.setdefault(level, {})
+        value = _metadata_value(n, rng)
+        node[f"param{n}"] = {"value": value}
+        path = ".".join(["$", "metadata", *levels, f"param{n}"])
+        datum = {
+            "key": f"Param{n}",
+            "iri": f"{BASE_IRI}Parameter{n}",
+            "value_location": f"{path}.value",
+        }
+        if isinstance(value, float):
+            node[f"param{n}"]["unit"] = _unit(n)
+            datum["unit_location"] = f"{path}.unit"
+        mapping.append(datum)
+    for n in range(arrays):
+        document["data"][f"series{n}"] = {
+            "unit": _unit(n),
+            "values": [rng.random() for _ in range(array_length)],
+        }
+        mapping.append(
+            {
+                "key": f"Series{n}",
+                "iri": f"{BASE_IRI}Series{n}",
+                "value_location": f"$.data.series{n}.values",
+                "unit_location": f"$.data.series{n}.unit",
+            }
+        )
+    for n in range(unmapped_arrays):
+        document["data"][f"unmapped{n}"] = {
+            "unit": _unit(n),
+            "values": [rng.random() for _ in range(array_length)],
+        }
+
+    if source_items:
+        document["samples"] = [
+            {"name": f"Sample{n}", "width": rng.random(), "lab": n % 10}
+            for n in range(source_items)
+        ]
+        mapping.append(
+            {
+                "iri": f"{BASE_IRI}Sample",
+                "source": "$.samples[*]",
+                "suffix": "name",
+                "suffix_from_location": True,
+                "custom_relations": [
+                    {
+                        "object_location": location,
+                        "relation": f"{BASE_IRI}has{location.title()}",
+                    }
+                    for location in ["name", "width", "lab"]
+                ],
+            }
+        )
+
+    path = os.path.join(directory, "abox.json")
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file)
+    return SyntheticInput(
+        parser="json",
+        mode="abox",
+        raw_data=path,
+        mapping=mapping,
+        parser_args={"expand_array": expand_array, "streaming": streaming},
+        rows=array_length,
+        size=os.path.getsize(path),
+    )
+
+
+def _tbox_records(classes: int, seed: int) -> List[Dict[str, str]]:
+    rng = random.Random(seed)
+    records = []
+    for n in range(classes):
+        records.append(
+            {
+                "Concept": f"Concept{n}",
+                "Label": f"Concept {n}",
+                # leave some cells empty, as in sparse taxonomies
+                "Description": f"Description of concept {n}" if n % 3 else "",
+                "Unit": _unit(n),
+                "Parent": f"{BASE_IRI}Concept{rng.randrange(n)}" if n else "",
+            }
+        )
+    return records
+
+
+def _tbox_mapping() -> List[Dict[str, str]]:
+    return [
+        {"key": key, "relation": relation, "relation_type": relation_type}
+        for key, (relation, relation_type) in TBOX_COLUMNS.items()
+    ]
+
+
+def make_csv_tbox(
+    directory: str, classes: int = 1000, sep: str = ";", seed: int = 42
+) -> SyntheticInput:
+    """Write a CSV file with one class per row"""
+    records = _tbox_records(classes, seed)
+    keys = list(records[0])
+    lines = [sep.join(keys)]
+    lines += [sep.join(record[key] for key in keys) for record in records]
+    path = os.path.join(directory, "tbox.csv")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+    return SyntheticInput(
+        parser="csv",
+        mode="tbox",
+        raw_data=path,
+        mapping=_tbox_mapping(),
+        parser_args={"column_sep": sep, "suffix_location": "Concept"},
+        rows=classes,
+        size=os.path.getsize(path),
+    )
+
+
+def make_excel_tbox(
+    directory: str,
+    classes: int = 1000,
+    engine: str = "openpyxl",
+    seed: int = 42,
+) -> SyntheticInput:
+    """Write an excel workbook with one class per row, which may be read
+    with another reader of the parser"""
+    records = _tbox_records(classes, seed)
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = "Classes"
+    worksheet.append(list(records[0]))
+    for record in records:
+        worksheet.append([value or None for value in record.values()])
+    parser_args = {"sheet": "Classes", "suffix_location": "Concept"}
+    if engine != "openpyxl":
+        parser_args["engine"] = engine
+
+    path = os.path.join(directory, "tbox.xlsx")
+    workbook.save(path)
+    return SyntheticInput(
+        parser="excel",
+        mode="tbox",
+        raw_data=path,
+        mapping=_tbox_mapping(),
+        parser_args=parser_args,
+        rows=classes,
+        size=os.path.getsize(path),
+    )
+
+
+def make_json_tbox(
+    directory: str, classes: int = 1000, seed: int = 42
+) -> SyntheticInput:
+    """Write a json file with a list of one object per class"""
+    records = _tbox_records(classes, seed)
+    path = os.path.join(directory, "tbox.json")
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(records, file)
+    return SyntheticInput(
+        parser="json",
+        mode="tbox",
+        raw_data=path,
+        mapping=_tbox_mapping(),
+        parser_args={"suffix_location": "Concept"},
+        rows=classes,
+        size=os.path.getsize(path),
+    )
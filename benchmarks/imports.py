@@ -0,0 +1,56 @@
+"""Import time benchmarks of data2rdf"""
+
+import json
+import subprocess
+import sys
+from typing import Any, Dict
+
+HEAVY_MODULES = [
+    "pandas",
+    "numpy",
+    "openpyxl",
+    "jsonpath_ng",
+    "rdflib",
+    "requests",
+    "pydantic_settings",
+]
+
+IMPORTS = {
+    "package": "import data2rdf",
+    "pipeline": "from data2rdf import Data2RDF, Parser",
+    "csv_parser": "from data2rdf.parsers import CSVParser",
+    "excel_parser": "from data2rdf.parsers import ExcelParser",
+    "json_parser": "from data2rdf.parsers import JsonParser",
+}
+
+_CODE = """import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+modules = [name for name in {modules!r} if name in sys.modules]
+print(json.dumps({{"time": elapsed, "modules": modules}}))
+"""
+
+
+def run_import(name: str, repeat: int = 3) -> Dict[str, Any]:
+    """Time an import statement in fresh interpreters.
+    Returns the wall times and the heavy dependencies loaded by it."""
+    statement = IMPORTS[name]
+    code = _CODE.format(statement=statement, modules=HEAVY_MODULES)
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        times.append(result["time"])
+    return {
+        "import": name,
+        "statement": statement,
+        "repeat": repeat,
+        "wall_time_min": min(times),
+        "modules": result["modules"],
+    }
@@ -0,0 +1,140 @@
+"""Runner for the data2rdf benchmarks"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from importlib.metadata import version
+from typing import Any, Dict, List, Optional
+
+from . import QUDT_UNITS
+from .generators import SyntheticInput
+from .imports import IMPORTS, run_import
+from .scenarios import SCALES, SCENARIOS
+
+
+def _run_pipeline(synthetic: SyntheticInput) -> Any:
+    from data2rdf import Data2RDF, Parser
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        pipeline = Data2RDF(
+            raw_data=synthetic.raw_data,
+            mapping=synthetic.mapping,
+            parser=Parser[synthetic.parser],
+            mode=synthetic.mode,
+            parser_args=synthetic.parser_args,
+            config={"qudt_units": QUDT_UNITS},
+        )
+        pipeline.graph
+    return pipeline
+
+
+def run_scenario(
+    name: str, scale: str = "small", repeat: int = 3, warmup: int = 1
+) -> Dict[str, Any]:
+    """Generate the input of a scenario and run the pipeline on it.
+    Returns the wall times, the throughput, the peak of the memory
+    traced by `tracemalloc` and the stage summary of the last run."""
+    scenario = SCENARIOS[name]
+    with tempfile.TemporaryDirectory() as directory:
+        synthetic = scenario.make(directory, scale)
+        for _ in range(warmup):
+            _run_pipeline(synthetic)
+
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            pipeline = _run_pipeline(synthetic)
+            times.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            _run_pipeline(synthetic)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    best = min(times)
+    return {
+        "scenario": name,
+        "parser": synthetic.parser,
+        "mode": synthetic.mode,
+        "scale": scale,
+        "rows": synthetic.rows,
+        "input_bytes": synthetic.size,
+        "repeat": repeat,
+        "wall_time_min": best,
+        "wall_time_median": statistics.median(times),
+        "rows_per_second": synthetic.rows / best,
+        "megabytes_per_second": synthetic.size / best / 1e6,
+        "peak_memory_megabytes": peak / 1e6,
+        "stages": pipeline.stats.summary(),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point of the benchmarks"""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run data2rdf benchmarks with synthetic data.",
+    )
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        help=f"""Scenarios to run, out of {", ".join(SCENARIOS)}.
+        All scenarios are run if none is given.""",
+    )
+    parser.add_argument("--scale", choices=list(SCALES), default="small")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument(
+        "--output", help="Path of the json file for the results."
+    )
+    parser.add_argument(
+        "--skip-imports",
+        action="store_true",
+        help="Do not measure the import times of data2rdf.",
+    )
+    args = parser.parse_args(argv)
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results = {
+        "data2rdf": version("data2rdf"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [],
+    }
+    if not args.skip_imports:
+        results["imports"] = []
+        for name in IMPORTS:
+            result = run_import(name, args.repeat)
+            results["imports"].append(result)
+            print(
+                f"import {name}: {result['wall_time_min']:.3f} s, "
+                f"loads {', '.join(result['modules']) or 'nothing heavy'}",
+                file=sys.stderr,
+            )
+    for name in args.scenarios or SCENARIOS:
+        result = run_scenario(name, args.scale, args.repeat, args.warmup)
+        results["results"].append(result)
+        print(
+            f"{name}: {result['wall_time_min']:.3f} s, "
+            f"{result['rows_per_second']:.0f} rows/s, "
+            f"{result['peak_memory_megabytes']:.1f} MB peak",
+            file=sys.stderr,
+        )
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
@@ -0,0 +1,96 @@
+"""Benchmark scenarios for each parser in ABox and TBox mode"""
+
+from typing import Any, Callable, Dict, NamedTuple
+
+from .generators import (
+    SyntheticInput,
+    make_csv_abox,
+    make_csv_tbox,
+    make_excel_abox,
+    make_excel_tbox,
+    make_json_abox,
+    make_json_tbox,
+)
+
+SCALES = {"small": 1, "medium": 10, "large": 100}
+
+
+class Scenario(NamedTuple):
+    """Generator of a scenario with fixed arguments and arguments
+    which are multiplied with the factor of the selected scale"""
+
+    generator: Callable[..., SyntheticInput]
+    fixed: Dict[str, Any]
+    scaled: Dict[str, int]
+
+    def make(self, directory: str, scale: str) -> SyntheticInput:
+        factor = SCALES[scale]
+        kwargs = {key: value * factor for key, value in self.scaled.items()}
+        return self.generator(directory, **self.fixed, **kwargs)
+
+
+SCENARIOS = {
+    "csv_abox": Scenario(make_csv_abox, {}, {"rows": 1000}),
+    "csv_abox_wide": Scenario(make_csv_abox, {"columns": 200}, {"rows": 100}),
+    "csv_abox_pyarrow": Scenario(
+        make_csv_abox, {"engine": "pyarrow"}, {"rows": 1000}
+    ),
+    "csv_abox_wide_pyarrow": Scenario(
+        make_csv_abox, {"columns": 200, "engine": "pyarrow"}, {"rows": 100}
+    ),
+    "csv_abox_unmapped": Scenario(
+        make_csv_abox, {"columns": 400, "mapped_columns": 12}, {"rows": 100}
+    ),
+    "csv_abox_chunked": Scenario(
+        make_csv_abox, {"columns": 20, "chunksize": 10000}, {"rows": 10000}
+    ),
+    "csv_abox_metadata": Scenario(
+        make_csv_abox, {"rows": 10}, {"metadata_rows": 100}
+    ),
+    "excel_abox": Scenario(make_excel_abox, {}, {"rows": 500}),
+    "excel_abox_sheets": Scenario(
+        make_excel_abox, {"extra_sheets": 5}, {"rows": 500}
+    ),
+    "excel_abox_read_only": Scenario(
+        make_excel_abox, {"read_only": True}, {"rows": 500}
+    ),
+    "excel_abox_calamine": Scenario(
+        make_excel_abox, {"engine": "calamine"}, {"rows": 500}
+    ),
+    "excel_abox_multi": Scenario(
+        make_excel_abox, {"columns": 24, "data_sheets": 4}, {"rows": 200}
+    ),
+    "excel_abox_parallel": Scenario(
+        make_excel_abox,
+        {"columns": 24, "data_sheets": 4, "max_workers": 4},
+        {"rows": 200},
+    ),
+    "json_abox": Scenario(make_json_abox, {}, {"array_length": 1000}),
+    "json_abox_nested": Scenario(
+        make_json_abox, {"nesting": 10, "arrays": 1}, {"metadata_items": 100}
+    ),
+    "json_abox_expand": Scenario(
+        make_json_abox,
+        {"arrays": 2, "expand_array": True},
+        {"array_length": 50},
+    ),
+    "json_abox_unmapped": Scenario(
+        make_json_abox,
+        {"arrays": 2, "unmapped_arrays": 10},
+        {"array_length": 1000},
+    ),
+    "json_abox_streaming": Scenario(
+        make_json_abox,
+        {"arrays": 2, "unmapped_arrays": 10, "streaming": True},
+        {"array_length": 1000},
+    ),
+    "csv_tbox": Scenario(make_csv_tbox, {}, {"classes": 500}),
+    "excel_tbox": Scenario(make_excel_tbox, {}, {"classes": 500}),
+    "excel_tbox_calamine": Scenario(
+        make_excel_tbox, {"engine": "calamine"}, {"classes": 500}
+    ),
+    "json_abox_source": Scenario(
+        make_json_abox, {"arrays": 1}, {"source_items": 100}
+    ),
+    "json_tbox": Scenario(make_json_tbox, {}, {"classes": 500}),
+}
@@ -1,15 +1,43 @@
 """Data2RDF"""
 
-from .config import Config
-from .parsers import Parser
-from .pipelines import Data2RDF
-
-from .models import (  # isort:skip
-    ABoxBaseMapping,
-    BasicConceptMapping,
-    PropertyGraph,
-    QuantityGraph,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .config import Config
+    from .parsers import Parser
+    from .pipelines import Data2RDF
+
+    from .models import (  # isort:skip
+        ABoxBaseMapping,
+        BasicConceptMapping,
+        PropertyGraph,
+        QuantityGraph,
+    )
+
+# the submodules are imported on first access of their members,
+# so that `import data2rdf` does not load rdflib, pandas, etc.
+_IMPORTS = {
+    "Data2RDF": "pipelines",
+    "Config": "config",
+    "QuantityGraph": "models",
+    "PropertyGraph": "models",
+    "ABoxBaseMapping": "models",
+    "BasicConceptMapping": "models",
+    "Parser": "parsers",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _IMPORTS:
+        module = import_module(f"{__name__}.{_IMPORTS[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_IMPORTS])
+
 
 __all__ = [
     "Data2RDF",
@@ -6,13 +6,16 @@ from typing import List, Optional, Union
 from pydantic import AnyUrl, ConfigDict, Field, model_validator
 from pydantic_settings import BaseSettings
 
+from data2rdf.diagnostics import DiagnosticsMode
+
 
 class Config(BaseSettings):
     """Data2RDF configuration"""
 
     qudt_units: Union[str, AnyUrl] = Field(
         "http://qudt.org/2.1/vocab/unit",
-        description="URI to QUDT Unit ontology for unit conversion",
+        description="""URI or local file path to QUDT Unit
+        ontology for unit conversion""",
     )
 
     qudt_quantity_kinds: Union[str, AnyUrl] = Field(
@@ -79,6 +82,24 @@ class Config(BaseSettings):
         description="In TBox mode, exclude the title of the ontology in the graph.",
     )
 
+    full_validation: bool = Field(
+        False,
+        description="""Validate every model built by the parsers completely,
+        e.g. for debugging. Otherwise, models which only differ in their
+        value, key, iri and suffix, like the elements of an expanded array
+        or metadata with the same unit, are copied from the first validated
+        model.""",
+    )
+
+    diagnostics: DiagnosticsMode = Field(
+        DiagnosticsMode.WARN,
+        description="""Emission of mismatches and other diagnostics found
+        while parsing: `warn` for a warning per entry, `warn_once` for a
+        warning per category and key, `collect` for only collecting the
+        entries in the `diagnostics` of the parser or `raise` for raising
+        the first entry as exception.""",
+    )
+
     model_config = ConfigDict(extra="ignore")
 
     @model_validator(mode="after")
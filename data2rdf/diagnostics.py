@@ -0,0 +1,147 @@
+"""Data2RDF diagnostics"""
+
+import warnings
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from data2rdf.stats import count
+
+Message = Optional[Union[str, Callable[[Any, Any], str]]]
+
+_ACTIVE_DIAGNOSTICS: "ContextVar[Optional[Diagnostics]]" = ContextVar(
+    "data2rdf_active_diagnostics", default=None
+)
+
+# number of all entries reported in the process, e.g. for checking whether
+# the construction of a model reported anything
+_REPORTED = 0
+
+
+class DiagnosticsMode(str, Enum):
+    """Emission modes for the diagnostics of a parser run"""
+
+    WARN = "warn"
+    WARN_ONCE = "warn_once"
+    COLLECT = "collect"
+    RAISE = "raise"
+
+
+def _render(
+    category: Type[Warning], key: Any, location: Any, message: Message
+) -> str:
+    if callable(message):
+        message = message(key, location)
+    elif message is None:
+        message = f"{category.__name__} for key `{key}` at `{location}`."
+    return message
+
+
+class Diagnostics(BaseModel):
+    """Collector for mismatches and other diagnostics of a parser run.
+
+    Each entry is counted by its category, key and location. Depending on
+    the `mode`, an entry is additionally emitted as warning (`warn`), only
+    the first entry per category and key is emitted as warning
+    (`warn_once`), the entries are only collected (`collect`) or the first
+    entry is raised as exception (`raise`).
+
+    The message of an entry can be a callable taking the key and the location,
+    so that it only is rendered when it actually is emitted."""
+
+    mode: DiagnosticsMode = Field(
+        DiagnosticsMode.WARN, description="Emission mode of the entries."
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _counts: Counter = PrivateAttr(default_factory=Counter)
+    _messages: Dict[
+        Tuple[Type[Warning], Any], Tuple[Any, Message]
+    ] = PrivateAttr(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        """Number of all reported entries"""
+        return sum(self._counts.values())
+
+    def report(
+        self,
+        category: Type[Warning],
+        key: Any,
+        location: Any = None,
+        message: Message = None,
+    ) -> None:
+        """Record an entry and emit it according to the mode"""
+        count("warnings")
+        self._counts[(category, key, location)] += 1
+        group = (category, key)
+        first = group not in self._messages
+        if first:
+            self._messages[group] = (location, message)
+        if self.mode == DiagnosticsMode.COLLECT or (
+            self.mode == DiagnosticsMode.WARN_ONCE and not first
+        ):
+            return
+        text = _render(category, key, location, message)
+        if self.mode == DiagnosticsMode.RAISE:
+            raise category(text)
+        warnings.warn(text, category, stacklevel=3)
+
+    def summary(self) -> Dict[str, Dict[Any, Dict[Any, int]]]:
+        """Return the counts grouped by category, key and location"""
+        summary = {}
+        for (category, key, location), number in self._counts.items():
+            locations = summary.setdefault(category.__name__, {}).setdefault(
+                key, {}
+            )
+            locations[location] = number
+        return summary
+
+    def messages(self) -> Dict[str, Dict[Any, str]]:
+        """Return the rendered message of the first entry
+        per category and key"""
+        messages = {}
+        for (category, key), (location, message) in self._messages.items():
+            messages.setdefault(category.__name__, {})[key] = _render(
+                category, key, location, message
+            )
+        return messages
+
+    @contextmanager
+    def activate(self) -> Iterator["Diagnostics"]:
+        """Make this collector the target of `report`"""
+        token = _ACTIVE_DIAGNOSTICS.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_DIAGNOSTICS.reset(token)
+
+
+def reported() -> int:
+    """Return the number of all entries reported in the process"""
+    return _REPORTED
+
+
+def report(
+    category: Type[Warning],
+    key: Any,
+    location: Any = None,
+    message: Message = None,
+) -> None:
+    """Report an entry to the active `Diagnostics`.
+    Without an active collector, the entry is emitted as warning."""
+    global _REPORTED
+    _REPORTED += 1
+    diagnostics = _ACTIVE_DIAGNOSTICS.get()
+    if diagnostics is None:
+        count("warnings")
+        warnings.warn(
+            _render(category, key, location, message), category, stacklevel=2
+        )
+    else:
+        diagnostics.report(category, key, location, message)
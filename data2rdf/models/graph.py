@@ -1,11 +1,12 @@
 """Models for graph construction from semantic concepts"""
 
-import warnings
-from typing import Any, Dict, List, Optional, Union
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
+from data2rdf.diagnostics import report, reported
 from data2rdf.qudt.utils import _get_qudt_label_and_symbol, _get_query_match
 from data2rdf.utils import make_prefix, split_namespace
-from data2rdf.warnings import ParserWarning
+from data2rdf.warnings import ParserWarning, QUDTMappingWarning
 
 from data2rdf.models.utils import (  # isort:skip
     apply_datatype,
@@ -156,6 +157,67 @@ class MeasurementUnit(BaseConfigModel):
         return self
 
 
+# fields which are replaced when copying a validated model and the types
+# of the values which can be taken over without validation
+_COPIED_FIELDS = ("key", "iri", "suffix")
+_QUANTITY_TYPES = (int, float, str, type(None))
+_PROPERTY_TYPES = (str, int, float, bool, type(None))
+
+
+def _python_scalar(value: Any) -> Any:
+    """Convert a numpy scalar, e.g. of a dataframe column or a streamed
+    array, into the according python object. numpy is not imported here,
+    since its scalars only occur if it was imported by a parser before."""
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(value, numpy.generic):
+        value = value.item()
+    return value
+
+
+def _validate_update(
+    model: "Union[PropertyGraph, QuantityGraph]", update: Dict[str, Any]
+) -> "Optional[Dict[str, Any]]":
+    """Validate the iri of the update of a model copy and derive the
+    suffix from it, like the validators of the model do.
+    Returns `None` if the copy must be validated completely instead."""
+    if "iri" in update:
+        update["iri"] = model.validate_iri(update["iri"])
+        if isinstance(update["iri"], list) and update.get("suffix") is None:
+            return None
+        update["suffix"] = (
+            update.get("suffix")
+            or str(update["iri"]).split(model.config.separator)[-1]
+        )
+    return update
+
+
+def _cast_message(key: Optional[str], value: Any) -> str:
+    return f"Cannot type case value from str into float or int: {value}"
+
+
+def _no_unit_message(symbol: str, key: Optional[str]) -> str:
+    return f"No QUDT Mapping found for unit with symbol `{symbol}`."
+
+
+def _multiple_units_message(symbol: str, key: Optional[str]) -> str:
+    return f"Multiple QUDT Mappings found for unit with symbol `{symbol}`."
+
+
+def _cast_quantity_value(value: Any, key: Optional[str]) -> Any:
+    if isinstance(value, str) and is_integer(value):
+        value = int(value)
+    elif isinstance(value, str) and is_float(value):
+        value = float(value)
+    elif isinstance(value, str):
+        report(
+            ParserWarning,
+            key,
+            value,
+            _cast_message,
+        )
+    return value
+
+
 class QuantityGraph(BasicGraphModel, BasicSuffixModel):
     """Quantity with or without a discrete value and a unit
     E.g. a quantity with a single value and unit _or_
@@ -191,18 +253,9 @@ class QuantityGraph(BasicGraphModel, BasicSuffixModel):
     @field_validator("value", mode="after")
     @classmethod
     def validate_value(
-        cls, value: Union[int, float, str]
+        cls, value: Union[int, float, str], info: ValidationInfo
     ) -> Union[int, float]:
-        if isinstance(value, str) and is_integer(value):
-            value = int(value)
-        elif isinstance(value, str) and is_float(value):
-            value = float(value)
-        elif isinstance(value, str):
-            warnings.warn(
-                f"Cannot type case value from str into float or int: {value}",
-                ParserWarning,
-            )
-        return value
+        return _cast_quantity_value(value, info.data.get("key"))
 
     @field_validator("unit", mode="after")
     @classmethod
@@ -214,13 +267,19 @@ class QuantityGraph(BasicGraphModel, BasicSuffixModel):
             if not (value.startswith("https:") or value.startswith("http:")):
                 match = _get_query_match(value, config.qudt_units)
                 if len(match) == 0:
-                    warnings.warn(
-                        f"No QUDT Mapping found for unit with symbol `{value}`."
+                    report(
+                        QUDTMappingWarning,
+                        value,
+                        info.data.get("key"),
+                        _no_unit_message,
                     )
                     value = None
                 elif len(match) > 1:
-                    warnings.warn(
-                        f"Multiple QUDT Mappings found for unit with symbol `{value}`."
+                    report(
+                        QUDTMappingWarning,
+                        value,
+                        info.data.get("key"),
+                        _multiple_units_message,
                     )
                     value = match.pop()
                 else:
@@ -233,11 +292,30 @@ class QuantityGraph(BasicGraphModel, BasicSuffixModel):
     @classmethod
     def validate_quantity_graph(cls, self) -> "QuantityGraph":
         if not self.measurement_unit and self.unit:
-            self.measurement_unit = MeasurementUnit(iri=self.unit)
+            self.measurement_unit = MeasurementUnit(
+                iri=self.unit, config=self.config
+            )
         if self.measurement_unit and not self.unit:
             self.unit = self.measurement_unit.iri
         return self
 
+    def _with_value(
+        self, value: Any, **update: Any
+    ) -> "Optional[QuantityGraph]":
+        """Return a copy of this validated model with another value and
+        optionally another key, iri and suffix.
+        Returns `None` if the copy must be validated completely instead."""
+        value = _python_scalar(value)
+        if self.config.full_validation or type(value) not in _QUANTITY_TYPES:
+            return None
+        update = _validate_update(self, update)
+        if update is None:
+            return None
+        update["value"] = _cast_quantity_value(
+            value, update.get("key", self.key)
+        )
+        return self.model_copy(update=update)
+
     @property
     def json_ld(self) -> Dict[str, Any]:
         """Return dict of json-ld for graph"""
@@ -352,6 +430,25 @@ class PropertyGraph(BasicGraphModel, BasicSuffixModel):
                 )
         return self
 
+    def _with_value(
+        self, value: Any, **update: Any
+    ) -> "Optional[PropertyGraph]":
+        """Return a copy of this validated model with another value and
+        optionally another key, iri and suffix.
+        Returns `None` if the copy must be validated completely instead."""
+        value = _python_scalar(value)
+        if (
+            self.config.full_validation
+            or self.annotation
+            or type(value) not in _PROPERTY_TYPES
+        ):
+            return None
+        update = _validate_update(self, update)
+        if update is None:
+            return None
+        update["value"] = value
+        return self.model_copy(update=update)
+
     @property
     def json_ld(self) -> Dict[str, Any]:
         """Return dict of json-ld for graph"""
@@ -409,3 +506,64 @@ class PropertyGraph(BasicGraphModel, BasicSuffixModel):
                 ]
             }
         return types
+
+
+def _template_key(
+    model: "Type[Union[PropertyGraph, QuantityGraph]]", data: Dict[str, Any]
+) -> "Tuple[Any, ...]":
+    """Key of the data of a model apart from the values of the fields
+    which can be replaced in a copy of it"""
+    return (
+        model,
+        tuple(name for name in _COPIED_FIELDS if name in data),
+        tuple(
+            (name, id(value) if name == "config" else repr(value))
+            for name, value in sorted(data.items())
+            if name not in _COPIED_FIELDS
+        ),
+    )
+
+
+def _make_graph(
+    model: "Type[Union[PropertyGraph, QuantityGraph]]",
+    templates: "Dict[Tuple[Any, ...], Union[PropertyGraph, QuantityGraph]]",
+    value: Any = None,
+    **data: Any,
+) -> "Union[PropertyGraph, QuantityGraph]":
+    """Make a graph model for the value and the data of a validated mapping.
+
+    If a model was made before from the same data apart from the value,
+    key, iri and suffix, e.g. with the same unit and config, the new model
+    is a copy of it, so that e.g. the config and the unit are not validated
+    again. The models made are kept as templates in `templates`, unless
+    their validation reported anything, e.g. an unknown unit, which then
+    is reported again for every model. Values which need a complete
+    validation and the `full_validation` option of the config fall back to
+    the regular construction of the model."""
+    key = _template_key(model, data)
+    template = templates.get(key)
+    graph = None
+    if template is not None:
+        update = {name: data[name] for name in _COPIED_FIELDS if name in data}
+        graph = template._with_value(value, **update)
+    if graph is None:
+        before = reported()
+        graph = model(**data, value=value)
+        if reported() == before:
+            templates.setdefault(key, graph)
+    return graph
+
+
+def _make_graphs(
+    model: "Type[Union[PropertyGraph, QuantityGraph]]",
+    values: Iterable[Any],
+    **data: Any,
+) -> "List[Union[PropertyGraph, QuantityGraph]]":
+    """Make a graph model for each of the values with otherwise equal data.
+
+    The data is validated once with the first value. The models for the
+    following values are copies of the first model, so that e.g. the IRIs,
+    the config and the unit are not validated again for every element of
+    an expanded array."""
+    templates = {}
+    return [_make_graph(model, templates, value, **data) for value in values]
@@ -1,14 +1,67 @@
-"""Data2RDF parsers."""
+"""Data2RDF parsers.
+
+The parser modules and their dependencies, e.g. pandas, openpyxl or
+jsonpath_ng, are only imported when a parser is used for the first time."""
 
 from enum import Enum
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Optional, Type, Union
+
+if TYPE_CHECKING:
+    from .csv import CSVParser
+    from .excel import ExcelParser
+    from .json import JsonParser
+
+_PARSERS = {
+    "CSVParser": "csv",
+    "ExcelParser": "excel",
+    "JsonParser": "json",
+}
+
+
+class _LazyParser:
+    """Reference to a parser class which is imported on first use"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def load(self) -> "Type[Union[CSVParser, ExcelParser, JsonParser]]":
+        """Import and return the parser class"""
+        module = import_module(f"{__name__}.{_PARSERS[self.name]}")
+        return getattr(module, self.name)
+
+    def __call__(
+        self, *args: Any, **kwargs: Any
+    ) -> "Union[CSVParser, ExcelParser, JsonParser]":
+        """Run the parser"""
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r})"
+
+
+class Parser(Enum):
+    """Available parsers for the types of raw data files"""
+
+    csv = _LazyParser("CSVParser")
+    excel = _LazyParser("ExcelParser")
+    json = _LazyParser("JsonParser")
+
+    @classmethod
+    def _missing_(cls, value: Any) -> "Optional[Parser]":
+        """Look up the member of a parser class"""
+        if isinstance(value, type):
+            for member in cls:
+                if member.value.name == value.__name__:
+                    if member.value.load() is value:
+                        return member
+        return None
+
 
-from .csv import CSVParser
-from .excel import ExcelParser
-from .json import JsonParser
+def __getattr__(name: str) -> Any:
+    if name in _PARSERS:
+        return _LazyParser(name).load()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-Parser = Enum(
-    "Parser",
-    {"csv": CSVParser, "excel": ExcelParser, "json": JsonParser},
-)
 
 __all__ = ["Parser"]
@@ -3,18 +3,22 @@
 import json
 import warnings
 from abc import abstractmethod
+from io import IOBase
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 from rdflib import Graph
 
 from data2rdf.config import Config
+from data2rdf.diagnostics import Diagnostics
 from data2rdf.modes import PipelineMode
+from data2rdf.stats import count, stage
 
 from .utils import load_mapping_file
 
 from pydantic import (  # isort:skip
     BaseModel,
     Field,
+    InstanceOf,
     PrivateAttr,
     field_validator,
     model_validator,
@@ -31,11 +35,16 @@ if TYPE_CHECKING:
 class BaseParser(BaseModel):
     """Basic Parser for any data file and mode"""
 
-    raw_data: Union[str, bytes, Dict[str, Any], List[Dict[str, Any]]] = Field(
+    # file objects come first, so that they are not consumed by
+    # trying to validate them as list
+    raw_data: Union[
+        InstanceOf[IOBase], str, bytes, Dict[str, Any], List[Dict[str, Any]]
+    ] = Field(
         ...,
         description="""
-        In case of a csv: `str` with the file path or the content of the file itself.
-        In case of a json file: `dict` for the content of the file of `str` for the file content or file path.
+        In case of a csv: `str` with the file path or the content of the file itself, `bytes` or a file object.
+        In case of a json file: `dict` for the content of the file of `str` for the file content or file path, `bytes` or a file object.
+        Files, `bytes` and file objects of csv and json files may be compressed with gzip, bz2, xz or zstd.
         In case of an excel file: `btyes` for the content or `str` for the file path""",
     )
     mapping: Union[str, List[Any]] = Field(
@@ -65,6 +74,14 @@ class BaseParser(BaseModel):
 class AnyBoxBaseParser(BaseParser):
     """Basic parser for A Box or T Box producing an RDF"""
 
+    _diagnostics: Diagnostics = PrivateAttr()
+
+    @property
+    def diagnostics(self) -> Diagnostics:
+        """Return the collector of the mismatches and other diagnostics
+        found while parsing"""
+        return self._diagnostics
+
     @property
     @abstractmethod
     def json_ld(self) -> Dict[str, Any]:
@@ -116,13 +133,23 @@ class AnyBoxBaseParser(BaseParser):
             BaseParser: The parsed `BaseParser` instance.
         """
 
-        datafile: Any = cls._load_data_file(self)
-        mapping: "Dict[str, BaseParser]" = load_mapping_file(
-            self.mapping, self.config, self.mapping_model
-        )
-        cls._run_parser(self, datafile, mapping)
+        self._diagnostics = Diagnostics(mode=self.config.diagnostics)
+        with self._diagnostics.activate():
+            with stage("load_data_file"):
+                datafile: Any = cls._load_data_file(self)
+            with stage("load_mapping_file"):
+                mapping: "Dict[str, BaseParser]" = load_mapping_file(
+                    self.mapping, self.config, self.mapping_model
+                )
+                count("mappings", len(mapping))
+            with stage("run_parser"):
+                cls._run_parser(self, datafile, mapping)
+                self._count_results()
         return self
 
+    def _count_results(self) -> None:
+        """Report the counters of the parsed results to the active stats"""
+
 
 class TBoxBaseParser(AnyBoxBaseParser):
     """Basic Parser for TBox mode"""
@@ -166,6 +193,11 @@ class TBoxBaseParser(AnyBoxBaseParser):
         """Return list object with class models"""
         return self._classes
 
+    # OVERRIDE
+    def _count_results(self) -> None:
+        """Report the number of class models to the active stats"""
+        count("models", len(self.classes))
+
 
 class ABoxBaseParser(AnyBoxBaseParser):
     """Basic Parser for ABox mode"""
@@ -184,6 +216,19 @@ class ABoxBaseParser(AnyBoxBaseParser):
         """Return list object with general metadata"""
         return self._dataframe_metadata
 
+    # OVERRIDE
+    def _count_results(self) -> None:
+        """Report the size of the dataframe and the number of
+        metadata models to the active stats"""
+        count(
+            "models",
+            len(self.general_metadata) + len(self.dataframe_metadata),
+        )
+        if self.dataframe is not None:
+            rows, columns = self.dataframe.shape
+            count("rows", rows)
+            count("columns", columns)
+
     @property
     def dataframe(self) -> "pd.DataFrame":
         """Return times series found in the data as pd.DataFrame"""
@@ -312,6 +357,15 @@ class BaseFileParser(BaseParser):
             raise TypeError(f"Operating mode not understood: {self.mode}")
         return self
 
+    @property
+    def diagnostics(self) -> Diagnostics:
+        """Return the collector of the mismatches and other diagnostics
+        found while parsing"""
+        if self.mode == PipelineMode.ABOX:
+            return self.abox.diagnostics
+        else:
+            return self.tbox.diagnostics
+
     @property
     def plain_metadata(self) -> Dict[str, Any]:
         """Metadata as flat json - without units and iris.
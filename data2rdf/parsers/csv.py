@@ -1,21 +1,47 @@
 """CSV Parser for data2rdf"""
 
+import csv
+import mmap
 import os
-import warnings
-from io import StringIO
-from typing import Any, Dict, List, Optional, Union
+from contextlib import contextmanager
+from enum import Enum
+from importlib.util import find_spec
+from io import BytesIO, IOBase, StringIO
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Container,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import urljoin
 
 import numpy as np
 import pandas as pd
-from pydantic import AliasChoices, Field
+from pandas.api.types import is_string_dtype
+from pydantic import AliasChoices, BaseModel, Field, PrivateAttr
 
-from data2rdf.models.graph import PropertyGraph, QuantityGraph
+from data2rdf.config import Config
+from data2rdf.diagnostics import report
+from data2rdf.models.graph import PropertyGraph, QuantityGraph, _make_graph
+from data2rdf.stats import count
 from data2rdf.utils import make_prefix
 from data2rdf.warnings import MappingMissmatchWarning, ParserWarning
 
 from .base import ABoxBaseParser, BaseFileParser, TBoxBaseParser
-from .utils import _make_tbox_classes, _make_tbox_json_ld, _strip_unit
+from .utils import (
+    _decompress,
+    _make_tbox_classes,
+    _make_tbox_json_ld,
+    _strip_unit,
+    _unmatched_key_message,
+    _unmatched_keys_message,
+)
 
 from data2rdf.models.mapping import (  # isort:skip
     ABoxBaseMapping,
@@ -31,21 +57,180 @@ def _replace(value: Optional[str], to_be_replaced: List[str]) -> Any:
     return value
 
 
-def _load_data_file(self: "Union[CSVTBoxParser, CSVABoxParser]") -> StringIO:
-    """Load csv file"""
+def _remove_from_dataframe(
+    df: pd.DataFrame, to_be_removed: List[str]
+) -> pd.DataFrame:
+    """Remove the given characters from all strings of the dataframe.
+
+    The removal is done per column with vectorized string operations.
+    Columns which cannot hold strings, e.g. numeric columns, and columns
+    of strings without any of the characters are skipped. Values which
+    are not strings are kept as they are."""
+    for name, column in df.items():
+        if not to_be_removed or not is_string_dtype(column.dtype):
+            continue
+        try:
+            # quick scan in C, if the column only consists of strings
+            joined = "".join(column.tolist())
+        except TypeError:
+            joined = None
+        if joined is not None and not any(
+            chars in joined for chars in to_be_removed
+        ):
+            continue
+        cleaned = column
+        for chars in to_be_removed:
+            cleaned = cleaned.str.replace(chars, "", regex=False)
+        # values which are not strings became NaN and are restored
+        df[name] = cleaned.where(cleaned.notna(), column)
+    return df
+
+
+class CSVEngine(str, Enum):
+    """Engines of pandas for reading csv files"""
+
+    C = "c"
+    PYTHON = "python"
+    PYARROW = "pyarrow"
+
+
+def _csv_engine(self: "Union[CSVTBoxParser, CSVABoxParser]") -> str:
+    """Return the engine for reading the body of the csv file.
+    The pyarrow engine falls back to another engine if pyarrow is not
+    installed, if the dataframe is read in chunks or if the separator is
+    longer than one character. Separators longer than one character are
+    regular expressions, which are only supported by the python engine,
+    except for `\\s+`, which is also supported by the C engine. Hence the
+    C engine falls back to the python engine for them."""
+    engine = CSVEngine(self.engine)
+    sep = getattr(self, "dataframe_sep", None) or getattr(
+        self, "column_sep", None
+    )
+    regex = bool(sep) and len(sep) > 1 and sep != r"\s+"
+    reason = None
+    if engine == CSVEngine.PYARROW:
+        if getattr(self, "chunksize", None):
+            reason = "does not support reading the dataframe in chunks"
+        elif find_spec("pyarrow") is None:
+            reason = "requires `pyarrow` to be installed"
+        elif sep and len(sep) > 1:
+            reason = "does not support separators longer than one character"
+    elif engine == CSVEngine.C and regex:
+        reason = "does not support regular expressions as separator"
+    if reason:
+        fallback = CSVEngine.PYTHON if regex else CSVEngine.C
+        report(
+            ParserWarning,
+            "engine",
+            message=f"The `{engine.value}` engine {reason}. Falling back to the `{fallback.value}` engine.",
+        )
+        engine = fallback
+    return engine.value
+
+
+def _load_data_file(
+    self: "Union[CSVTBoxParser, CSVABoxParser]",
+) -> "Union[str, IO]":
+    """Return the path of the csv file or a stream of its content.
+    Files and streams are not read here, but passed directly to the readers
+    in order to avoid an additional copy of the file content in memory."""
     if isinstance(self.raw_data, str):
         if os.path.isfile(self.raw_data):
-            with open(self.raw_data, encoding=self.config.encoding) as file:
-                content = StringIO(file.read())
+            content = self.raw_data
         else:
             content = StringIO(self.raw_data)
+    elif isinstance(self.raw_data, bytes):
+        content = BytesIO(self.raw_data)
+    elif isinstance(self.raw_data, IOBase):
+        content = self.raw_data
     else:
         raise TypeError(
-            f"`raw_data` must be of type `str`, not `{type(self.raw_data)}`"
+            f"""`raw_data` must be of type `str`, `bytes` or a file object,
+            not `{type(self.raw_data)}`"""
         )
     return content
 
 
+def _read_csv(
+    self: "Union[CSVTBoxParser, CSVABoxParser]",
+    datafile: "Union[str, IO]",
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Read a csv file from a path or a stream with the parser settings.
+    Streams are read from their beginning."""
+    with _open_data_file(self, datafile) as file:
+        return pd.read_csv(
+            file,
+            encoding=self.config.encoding,
+            engine=_csv_engine(self),
+            **kwargs,
+        )
+
+
+def _join_lines(lines: "List[Union[str, bytes]]") -> "IO":
+    """Join lines read from a csv file into a new stream"""
+    if lines and isinstance(lines[0], bytes):
+        return BytesIO(b"".join(lines))
+    return StringIO("".join(lines))
+
+
+def _read_records(
+    self: "Union[CSVTBoxParser, CSVABoxParser]",
+    file: "IO",
+    number: int,
+    sep: "Optional[str]",
+) -> "List[Union[str, bytes]]":
+    """Read the lines of the next `number` records of the csv stream.
+    A quoted value of a record may span several lines, hence the records
+    are delimited by a csv reader and the stream is left at the position
+    after the last of their lines."""
+    lines = []
+
+    def read() -> "Iterator[str]":
+        while True:
+            line = file.readline()
+            if not line:
+                return
+            lines.append(line)
+            if isinstance(line, bytes):
+                line = line.decode(self.config.encoding)
+            yield line
+
+    delimiter = sep if sep and len(sep) == 1 else ","
+    reader = csv.reader(read(), delimiter=delimiter)
+    for _ in range(number):
+        if next(reader, None) is None:
+            break
+    return lines
+
+
+@contextmanager
+def _open_data_file(
+    self: "Union[CSVTBoxParser, CSVABoxParser]", datafile: "Union[str, IO]"
+) -> "Iterator[IO]":
+    """Open the csv file for reading it line by line from its beginning.
+    Compressed files and streams are decompressed on the fly. Otherwise,
+    if `memory_map` is set, a file path is mapped into memory. Streams
+    which are not seekable are read from their current position."""
+    if isinstance(datafile, str):
+        with open(datafile, mode="rb") as file:
+            stream = _decompress(file)
+            if stream is not file:
+                with stream:
+                    yield stream
+            elif self.memory_map and os.path.getsize(datafile):
+                with mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped:
+                    yield mapped
+            else:
+                yield file
+    else:
+        if datafile.seekable():
+            datafile.seek(0)
+        yield _decompress(datafile)
+
+
 class CSVTBoxParser(TBoxBaseParser):
     """
     CSV file parser in tbox mode
@@ -65,6 +250,17 @@ class CSVTBoxParser(TBoxBaseParser):
     fillna: Optional[Any] = Field(
         "", description="Value to fill NaN values in the parsed dataframe."
     )
+    memory_map: bool = Field(
+        False,
+        description="""Map the csv file directly into memory and read it
+        from there, if `raw_data` is a file path.""",
+    )
+    engine: CSVEngine = Field(
+        CSVEngine.C,
+        description="""Engine of pandas for reading the csv file. The
+        multithreaded `pyarrow` engine is used if `pyarrow` is installed,
+        the `c` engine otherwise.""",
+    )
 
     # OVERRIDE
     @property
@@ -83,7 +279,7 @@ class CSVTBoxParser(TBoxBaseParser):
     def _run_parser(
         cls,
         self: "CSVTBoxParser",
-        datafile: StringIO,
+        datafile: "Union[str, IO]",
         mapping: "List[TBoxBaseMapping]",
     ) -> None:
         """
@@ -93,19 +289,19 @@ class CSVTBoxParser(TBoxBaseParser):
 
         Parameters:
             self (CSVTBoxParser): The instance of the parser.
-            datafile (StringIO): The CSV file to be parsed.
+            datafile (Union[str, IO]): Path or stream of the CSV file.
             mapping (List[TBoxBaseMapping]): The list of mappings to be applied.
 
         Returns:
             None
         """
 
-        df = pd.read_csv(datafile, sep=self.column_sep)
+        df = _read_csv(self, datafile, sep=self.column_sep)
         _make_tbox_classes(self, df, mapping)
 
     # OVERRIDE
     @classmethod
-    def _load_data_file(cls, self: "CSVTBoxParser") -> StringIO:
+    def _load_data_file(cls, self: "CSVTBoxParser") -> "Union[str, IO]":
         """Load CSV file"""
         return _load_data_file(self)
 
@@ -134,6 +330,30 @@ class CSVABoxParser(ABoxBaseParser):
     fillna: Optional[Any] = Field(
         "", description="Value to fill NaN values in the parsed dataframe."
     )
+    memory_map: bool = Field(
+        False,
+        description="""Map the csv file directly into memory and read it
+        from there, if `raw_data` is a file path.""",
+    )
+    engine: CSVEngine = Field(
+        CSVEngine.C,
+        description="""Engine of pandas for reading the csv file. The
+        multithreaded `pyarrow` engine is used if `pyarrow` is installed,
+        the `c` engine otherwise.""",
+    )
+    chunksize: Optional[int] = Field(
+        None,
+        description="""Number of rows of the dataframe to be read at once.
+        If set, the dataframe is not kept in memory, but each cleaned chunk
+        is passed to the `dataframe_callback`.""",
+        ge=1,
+    )
+    dataframe_callback: Optional[Callable[[pd.DataFrame], Any]] = Field(
+        None,
+        description="""Callable which is called with every chunk of the
+        dataframe if `chunksize` is set, e.g. for writing it to disk.""",
+        exclude=True,
+    )
     # OVERRIDE
     mapping: Union[str, List[ABoxBaseMapping]] = Field(
         ...,
@@ -304,7 +524,7 @@ class CSVABoxParser(ABoxBaseParser):
     def _run_parser(
         cls,
         self: "CSVParser",
-        datafile: StringIO,
+        datafile: "Union[str, IO]",
         mapping: "List[ABoxBaseMapping]",
     ) -> None:
         """
@@ -312,13 +532,14 @@ class CSVABoxParser(ABoxBaseParser):
 
         It takes in three parameters:
         - `self`: The CSVParser instance.
-        - `datafile`: The StringIO object containing the CSV data.
+        - `datafile`: The path or the stream of the CSV data.
         - `mapping`: A list of ABoxBaseMapping instances that map the CSV data to the desired output format.
 
         The function returns None, but it populates the following instance variables:
         - `self._general_metadata`: A list of PropertyGraph or QuantityGraph instances representing the general metadata.
         - `self._dataframe_metadata`: A list of QuantityGraph instances representing the dataframe metadata.
-        - `self._dataframe`: A pandas DataFrame containing the dataframe data.
+        - `self._dataframe`: A pandas DataFrame containing the dataframe data. If `chunksize` is set, the chunks
+            of the dataframe are passed to the `dataframe_callback` instead and this is None.
 
         The function also raises ValueError if the `metadata_length` is greater than 0 but `metadata_sep` is not set.
         It raises TypeError if the unit for a key is not a string.
@@ -333,32 +554,39 @@ class CSVABoxParser(ABoxBaseParser):
 
         mapping = {model.key: model for model in mapping}
 
-        dataframe: Union[pd.DataFrame, List[None]] = cls._parse_dataframe(
-            self, datafile
-        )
-        if self.dropna:
-            dataframe.dropna(inplace=True)
-        datafile.seek(0)
+        # read the file once: the lines of the metadata are taken first,
+        # the dataframe is then read from the position after them
+        with _open_data_file(self, datafile) as file:
+            metadata_lines = _read_records(
+                self, file, self.metadata_length, self.metadata_sep
+            )
+            names, columns, units = cls._parse_dataframe_header(
+                self, file, mapping
+            )
+            self._dataframe_metadata = []
+            suffixes = cls._parse_dataframe_metadata(
+                self, columns, units, mapping
+            )
+            dataframe = cls._parse_dataframe(self, file, names, columns)
+            if self.chunksize:
+                # only a single chunk of the dataframe is held in memory
+                self._dataframe = None
+                count("columns", len(suffixes))
+                for chunk in dataframe:
+                    chunk = cls._finalize_dataframe(self, chunk, suffixes)
+                    count("rows", len(chunk))
+                    if self.dataframe_callback:
+                        self.dataframe_callback(chunk)
+            else:
+                self._dataframe = cls._finalize_dataframe(
+                    self, dataframe, suffixes
+                )
 
         # iterate over general metadata
         self._general_metadata = []
+        templates = {}
         if self.metadata_length > 0:
-            if not self.metadata_sep:
-                raise ValueError(
-                    "`metadata_length` is > 0 but `metadata_sep` is not set"
-                )
-            metadata = pd.read_csv(
-                datafile,
-                sep=self.metadata_sep,
-                nrows=self.metadata_length,
-                names=["key", "value", "unit"],
-                header=None,
-            )
-            # remove unneeded characters
-            metadata = metadata.map(
-                lambda value: _replace(value, self.config.remove_from_datafile)
-            )
-            metadata.replace({np.nan: self.fillna}, inplace=True)
+            metadata = cls._parse_metadata(self, metadata_lines)
             for i, metadatum in metadata.iterrows():
                 # get the match from the mapping
                 mapping_match = mapping.get(metadatum.key)
@@ -394,35 +622,134 @@ class CSVABoxParser(ABoxBaseParser):
                             model_data[
                                 "unit_relation"
                             ] = mapping_match.unit_relation
-                        model = QuantityGraph(**model_data)
+                        model = _make_graph(
+                            QuantityGraph, templates, **model_data
+                        )
                     else:
-                        model = PropertyGraph(**model_data)
+                        model = _make_graph(
+                            PropertyGraph, templates, **model_data
+                        )
                     self._general_metadata.append(model)
                 else:
-                    warnings.warn(
-                        f"No match found in mapping for key `{metadatum.key}`",
+                    report(
                         MappingMissmatchWarning,
+                        metadatum.key,
+                        "metadata",
+                        _unmatched_key_message,
                     )
 
-        # parse dataframe data and meta data
-        self._dataframe_metadata = []
-        self._dataframe = {}
+    # OVERRIDE
+    @classmethod
+    def _load_data_file(cls, self: "CSVABoxParser") -> "Union[str, IO]":
+        """Load csv file"""
+        return _load_data_file(self)
+
+    @classmethod
+    def _parse_metadata(
+        cls, self: "CSVParser", metadata_lines: "List[Union[str, bytes]]"
+    ) -> pd.DataFrame:
+        """Parse the lines of the metadata into a dataframe with the
+        columns `key`, `value` and `unit`"""
+        if not self.metadata_sep:
+            raise ValueError(
+                "`metadata_length` is > 0 but `metadata_sep` is not set"
+            )
+        metadata = pd.read_csv(
+            _join_lines(metadata_lines),
+            encoding=self.config.encoding,
+            sep=self.metadata_sep,
+            names=["key", "value", "unit"],
+            header=None,
+        )
+        # remove unneeded characters
+        metadata = _remove_from_dataframe(
+            metadata, self.config.remove_from_datafile
+        )
+        metadata.replace({np.nan: self.fillna}, inplace=True)
+        return metadata
+
+    @classmethod
+    def _parse_dataframe_header(
+        cls,
+        self: "CSVParser",
+        datafile: "IO",
+        keys: "Optional[Container[str]]" = None,
+    ) -> "Tuple[List[str], List[str], Dict[str, str]]":
+        """Parse the header of the dataframe from the current position of
+        the stream. Returns the cleaned names of all columns, the names of
+        the columns to be parsed and the units of the columns, if the header
+        has a row of units.
+
+        If `keys` are given, only the columns whose cleaned names are in
+        the keys are parsed. All other columns are reported at once."""
+        if not self.dataframe_sep:
+            report(
+                ParserWarning,
+                "dataframe_sep",
+                message="`dataframe_sep` is not set. Any potential dataframe in the data file will be skipped.",
+            )
+            return [], [], {}
+
+        header_lines = _read_records(
+            self,
+            datafile,
+            max(self.dataframe_header_length, 1),
+            self.dataframe_sep,
+        )
+        header = pd.read_csv(
+            _join_lines(header_lines),
+            encoding=self.config.encoding,
+            sep=self.dataframe_sep,
+            dtype=str,
+            keep_default_na=False,
+        )
+        header = _remove_from_dataframe(
+            header, self.config.remove_from_datafile
+        )
+        names = [
+            _replace(column, self.config.remove_from_datafile)
+            for column in header.columns
+        ]
+
+        if keys is None:
+            columns = names
+        else:
+            columns = [name for name in names if name in keys]
+            unmapped = {name: None for name in names if name not in keys}
+            if unmapped:
+                report(
+                    MappingMissmatchWarning,
+                    tuple(unmapped),
+                    "dataframe",
+                    _unmatched_keys_message,
+                )
+
+        if self.dataframe_header_length == 2 and len(header):
+            units = dict(zip(names, header.iloc[0]))
+        else:
+            units = {}
+        return names, columns, units
 
-        for key in dataframe:
+    @classmethod
+    def _parse_dataframe_metadata(
+        cls,
+        self: "CSVParser",
+        columns: "List[str]",
+        units: "Dict[str, str]",
+        mapping: "Dict[str, ABoxBaseMapping]",
+    ) -> "Dict[str, str]":
+        """Make the models of the dataframe columns from the header alone.
+        Returns the names of the columns by the suffixes of their models."""
+        suffixes = {}
+        templates = {}
+
+        for key in columns:
             # get matching mapping
             mapping_match = mapping.get(key)
 
             if mapping_match:
                 # get unit
-                unit = (
-                    mapping_match.unit
-                    or (
-                        dataframe[key].iloc[0]
-                        if self.dataframe_header_length == 2
-                        else None
-                    )
-                    or None
-                )
+                unit = mapping_match.unit or units.get(key) or None
 
                 if unit:
                     if not isinstance(unit, str):
@@ -433,74 +760,169 @@ class CSVABoxParser(ABoxBaseParser):
                     unit = _strip_unit(unit, self.config.remove_from_unit)
 
                 # assign model
-                model = QuantityGraph(
-                    key=key,
-                    unit=unit,
-                    iri=mapping_match.iri,
-                    suffix=mapping_match.suffix,
-                    annotation=mapping_match.annotation or None,
-                    config=self.config,
-                )
+                model_data = {
+                    "key": key,
+                    "unit": unit,
+                    "iri": mapping_match.iri,
+                    "suffix": mapping_match.suffix,
+                    "annotation": mapping_match.annotation or None,
+                    "config": self.config,
+                }
                 if mapping_match.unit_relation:
-                    model.unit_relation = mapping_match.unit_relation
+                    model_data["unit_relation"] = mapping_match.unit_relation
+                model = _make_graph(QuantityGraph, templates, **model_data)
 
                 # append model
-                self.dataframe_metadata.append(model)
+                self._dataframe_metadata.append(model)
 
                 # assign dataframe data
-                self._dataframe[model.suffix] = dataframe[key][
-                    self.dataframe_header_length - 1 :
-                ].to_list()
+                suffixes[model.suffix] = key
+        return suffixes
 
-            else:
-                warnings.warn(
-                    f"No match found in mapping for key `{key}`",
-                    MappingMissmatchWarning,
-                )
-        # set dataframe as pd dataframe
-        self._dataframe = pd.DataFrame.from_dict(
-            self._dataframe, orient="index"
-        ).transpose()
+    @classmethod
+    def _parse_dataframe(
+        cls,
+        self: "CSVParser",
+        datafile: "IO",
+        names: "List[str]",
+        columns: "List[str]",
+    ) -> "Union[pd.DataFrame, Iterator[pd.DataFrame]]":
+        """Parse the body of the dataframe from the current position of the
+        stream until its end, so that its columns have numeric dtypes.
+        If `chunksize` is set, an iterator over the chunks is returned.
+
+        If `dropna` is set, all columns are parsed, since rows with NaN
+        in any of the columns are dropped, including the unmapped ones.
+        The pyarrow engine cannot select columns by the given names, hence
+        its columns are selected after parsing."""
+        if not names:
+            return iter([]) if self.chunksize else pd.DataFrame()
+        if self.dropna:
+            columns = names
+        engine = _csv_engine(self)
+        dataframe = pd.read_csv(
+            datafile,
+            encoding=self.config.encoding,
+            sep=self.dataframe_sep,
+            header=None,
+            names=names,
+            usecols=None if engine == CSVEngine.PYARROW else columns,
+            chunksize=self.chunksize,
+            engine=engine,
+        )
+        if engine == CSVEngine.PYARROW and len(columns) < len(names):
+            dataframe = dataframe[columns]
+        return dataframe
+
+    @classmethod
+    def _finalize_dataframe(
+        cls,
+        self: "CSVParser",
+        dataframe: pd.DataFrame,
+        suffixes: "Dict[str, str]",
+    ) -> pd.DataFrame:
+        """Clean the (chunk of the) dataframe and name its columns by the
+        suffixes of their models"""
+        dataframe = _remove_from_dataframe(
+            dataframe, self.config.remove_from_datafile
+        )
+        if self.dropna:
+            dataframe.dropna(inplace=True)
+        if len(suffixes) < len(dataframe.columns):
+            dataframe = dataframe[list(suffixes.values())]
+        dataframe.columns = list(suffixes)
         # check if drop na:
         if self.dropna:
-            self._dataframe.dropna(how="all", inplace=True)
+            dataframe.dropna(how="all", inplace=True)
+        return dataframe
+
+
+class CSVHeader(BaseModel):
+    """Keys of the metadata and titles of the dataframe columns in the
+    header of a csv file, each with its unit found in the file"""
+
+    metadata: Dict[str, Optional[str]] = Field(
+        {}, description="Keys of the metadata and their units."
+    )
+    columns: Dict[str, Optional[str]] = Field(
+        {}, description="Titles of the dataframe columns and their units."
+    )
+
+
+class CSVHeaderParser(CSVABoxParser):
+    """
+    CSV file parser in abox mode, which only parses the header of the file
+    """
 
     # OVERRIDE
-    @classmethod
-    def _load_data_file(cls, self: "CSVABoxParser") -> StringIO:
-        """Load csv file"""
-        return _load_data_file(self)
+    mapping: Union[str, List[ABoxBaseMapping]] = Field(
+        [], description="Not used for parsing the header."
+    )
+
+    _header: CSVHeader = PrivateAttr()
 
+    @property
+    def header(self) -> CSVHeader:
+        """Return the keys, column titles and units of the header"""
+        return self._header
+
+    # OVERRIDE
     @classmethod
-    def _parse_dataframe(
-        cls, self: "CSVParser", datafile: "StringIO"
-    ) -> Union[pd.DataFrame, List[None]]:
-        if self.dataframe_sep:
-            response = pd.read_csv(
-                datafile,
-                encoding=self.config.encoding,
-                sep=self.dataframe_sep,
-                skiprows=self.metadata_length,
-            )
-            response = response.map(
-                lambda value: _replace(value, self.config.remove_from_datafile)
-            )
-            response.columns = [
-                _replace(column, self.config.remove_from_datafile)
-                for column in response.columns
-            ]
-        else:
-            warnings.warn(
-                "`dataframe_sep` is not set. Any potential dataframe in the data file will be skipped.",
-                ParserWarning,
+    def _run_parser(
+        cls,
+        self: "CSVHeaderParser",
+        datafile: "Union[str, IO]",
+        mapping: "List[ABoxBaseMapping]",
+    ) -> None:
+        """Read only the lines of the metadata and of the dataframe header"""
+        with _open_data_file(self, datafile) as file:
+            metadata_lines = _read_records(
+                self, file, self.metadata_length, self.metadata_sep
             )
-            response = []
-        return response
+            names, _, units = cls._parse_dataframe_header(self, file)
+
+        header = CSVHeader()
+        if self.metadata_length > 0:
+            metadata = cls._parse_metadata(self, metadata_lines)
+            for key, unit in zip(metadata.key, metadata.unit):
+                header.metadata[key] = cls._clean_unit(self, unit)
+        for name in names:
+            header.columns[name] = cls._clean_unit(self, units.get(name))
+        self._header = header
+
+    @classmethod
+    def _clean_unit(cls, self: "CSVHeaderParser", unit: Any) -> Optional[str]:
+        """Strip the unit like the parser does, if there is any"""
+        if isinstance(unit, str) and unit:
+            return _strip_unit(unit, self.config.remove_from_unit)
+        return None
+
+    # OVERRIDE
+    def _count_results(self) -> None:
+        """Nothing is counted for the header"""
 
 
 class CSVParser(BaseFileParser):
     """Parser for CSV/TSV files"""
 
+    @classmethod
+    def inspect(
+        cls,
+        raw_data: "Union[str, bytes, IO]",
+        parser_args: "Optional[Dict[str, Any]]" = None,
+        config: "Optional[Union[Dict[str, Any], Config]]" = None,
+    ) -> CSVHeader:
+        """Read only the header of a csv file, i.e. the first
+        `metadata_length + dataframe_header_length` records, with the same
+        `parser_args` as the parser. Returns the keys of the metadata and
+        the titles of the dataframe columns with their units, without
+        parsing the dataframe or looking up the units in QUDT."""
+        return CSVHeaderParser(
+            raw_data=raw_data,
+            config=config or Config(),
+            **(parser_args or {}),
+        ).header
+
     # OVERRIDE
     @property
     def _abox_parser(self) -> CSVABoxParser:
@@ -1,17 +1,25 @@
 """Data2rdf excel parser"""
 
-import warnings
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, time
+from enum import Enum
+from functools import partial
+from importlib.util import find_spec
 from io import BytesIO
-from typing import Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Set, Tuple, Type, Union
 from urllib.parse import quote, urljoin
 
+import numpy as np
 import pandas as pd
-from openpyxl import load_workbook
+from openpyxl.reader.excel import ExcelReader
+from openpyxl.utils.cell import coordinate_to_tuple
 from pydantic import Field
 
-from data2rdf.models.graph import PropertyGraph, QuantityGraph
+from data2rdf.diagnostics import report
+from data2rdf.models.graph import PropertyGraph, QuantityGraph, _make_graph
 from data2rdf.utils import make_prefix
-from data2rdf.warnings import MappingMissmatchWarning
+from data2rdf.warnings import MappingMissmatchWarning, ParserWarning
 
 from .base import ABoxBaseParser, BaseFileParser, TBoxBaseParser
 
@@ -20,6 +28,11 @@ from .utils import (  # isort:skip
     _make_tbox_json_ld,
     _strip_unit,
     _value_exists,
+    _missing_dataframe_message,
+    _missing_iri_value_message,
+    _missing_unit_message,
+    _missing_value_message,
+    _unresolved_suffix_message,
 )
 
 from data2rdf.models.mapping import (  # isort:skip
@@ -29,6 +42,45 @@ from data2rdf.models.mapping import (  # isort:skip
     CustomRelationQuantitySubgraph,
 )
 
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+
+
+class ExcelEngine(str, Enum):
+    """Readers of excel workbooks"""
+
+    OPENPYXL = "openpyxl"
+    CALAMINE = "calamine"
+
+
+def _excel_engine(
+    self: "Union[ExcelTBoxParser, ExcelABoxParser]",
+) -> "Union[str, None]":
+    """Return the reader of the excel workbook, or None if the reader is
+    detected by pandas from the format of the workbook.
+    The calamine reader falls back to the default reader of the parser if
+    python-calamine is not installed or if the units are taken from the
+    macros of the cells."""
+    if self.engine is None:
+        return None
+    engine = ExcelEngine(self.engine)
+    if engine == ExcelEngine.CALAMINE:
+        if getattr(self, "unit_from_macro", False):
+            reason = "does not support reading the number formats of cells"
+        elif find_spec("python_calamine") is None:
+            reason = "requires `python-calamine` to be installed"
+        else:
+            reason = None
+        if reason:
+            engine = type(self).model_fields["engine"].default
+            fallback = f"`{engine.value}`" if engine else "default"
+            report(
+                ParserWarning,
+                "engine",
+                message=f"The `calamine` engine {reason}. Falling back to the {fallback} engine.",
+            )
+    return engine.value if engine else None
+
 
 def _load_data_file(
     self: "Union[ExcelTBoxParser, ExcelABoxParser]",
@@ -46,6 +98,384 @@ def _load_data_file(
     return content
 
 
+class _SheetsReader(ExcelReader):
+    """Reader of an excel workbook, which only parses the given worksheets.
+    The parts of the other sheets in the archive are never read."""
+
+    def __init__(
+        self, filename: BytesIO, sheets: "Iterable[str]", **kwargs: Any
+    ) -> None:
+        super().__init__(filename, **kwargs)
+        self.sheets = set(sheets)
+
+    def read_workbook(self) -> None:
+        super().read_workbook()
+        kept = [
+            index
+            for index, sheet in enumerate(self.parser.sheets)
+            if sheet.name in self.sheets
+        ]
+        self.parser.sheets = [self.parser.sheets[index] for index in kept]
+
+        # the names defined for a sheet refer to it by its position
+        positions = {old: new for new, old in enumerate(kept)}
+        names = self.parser.defined_names
+        names.definedName = [
+            name
+            for name in names.definedName
+            if name.localSheetId is None or name.localSheetId in positions
+        ]
+        for name in names.definedName:
+            if name.localSheetId is not None:
+                name.localSheetId = positions[name.localSheetId]
+
+
+def _load_workbook(
+    datafile: BytesIO, sheets: "Iterable[str]", read_only: bool
+) -> "Workbook":
+    """Load the given worksheets of an excel workbook with the cached
+    values of the formulas"""
+    reader = _SheetsReader(
+        datafile, sheets, read_only=read_only, data_only=True
+    )
+    reader.read()
+    return reader.wb
+
+
+def _to_array(values: "List[Any]") -> np.ndarray:
+    """Convert the values of a dataframe column into a typed array.
+    Empty cells at the end of the column are trimmed. Numeric columns
+    become integer or float arrays, with NaN for empty cells, while all
+    other columns are kept as object arrays."""
+    end = len(values)
+    while end and values[end - 1] is None:
+        end -= 1
+    values = values[:end]
+    types = set(map(type, values))
+    if types == {int}:
+        return np.array(values, dtype=np.int64)
+    if types <= {int, float, type(None)}:
+        return np.array(values, dtype=np.float64)
+    return np.array(values, dtype=object)
+
+
+def _make_dataframe(columns: "Dict[str, np.ndarray]") -> pd.DataFrame:
+    """Make a dataframe from columns of unequal length, which are padded
+    with empty values at their end"""
+    length = max(map(len, columns.values()), default=0)
+    padded = {}
+    for name, column in columns.items():
+        if len(column) < length:
+            if column.dtype.kind in "iuf":
+                fill = np.full(length, np.nan)
+            else:
+                fill = np.full(length, None, dtype=object)
+            fill[: len(column)] = column
+            column = fill
+        padded[name] = column
+    return pd.DataFrame(padded, index=pd.RangeIndex(length))
+
+
+class _SheetCells:
+    """Values and number formats of the cells of a worksheet and the
+    values of its dataframe columns, which are referenced by the mapping"""
+
+    def __init__(self, max_row: int) -> None:
+        self.max_row = max_row
+        self.values: Dict[str, Any] = {}
+        self.number_formats: Dict[str, str] = {}
+        self.columns: Dict[str, np.ndarray] = {}
+
+    def value(self, coordinate: str) -> Any:
+        """Return the value of a cell"""
+        return self.values.get(coordinate)
+
+    def number_format(self, coordinate: str) -> str:
+        """Return the number format of a cell"""
+        return self.number_formats.get(coordinate) or "General"
+
+    def column(self, start: str) -> np.ndarray:
+        """Return the values of a dataframe column from its start cell
+        until its last non-empty cell"""
+        return self.columns[start]
+
+
+def _make_plan(
+    mapping: "List[ABoxExcelMapping]",
+) -> "Dict[str, Tuple[Set[str], Set[str]]]":
+    """Collect the cells and the start cells of the dataframe columns,
+    which are referenced by the mapping, per worksheet"""
+    plan = {}
+    for datum in mapping:
+        cells, starts = plan.setdefault(datum.worksheet, (set(), set()))
+        if datum.suffix_from_location:
+            cells.add(datum.suffix)
+        for relation in datum.custom_relations or []:
+            cells.add(relation.object_location)
+        if datum.value_location:
+            cells.add(datum.value_location)
+        if datum.unit_location:
+            cells.add(datum.unit_location)
+        if datum.dataframe_start:
+            starts.add(datum.dataframe_start)
+    return plan
+
+
+class _WorkbookReader(ABC):
+    """Reader of the worksheets of an excel workbook, which are referenced
+    by the mapping. The backends of the reader provide the values and
+    number formats of the cells and the values of the dataframe columns
+    of a worksheet."""
+
+    @abstractmethod
+    def max_row(self, sheet: str) -> int:
+        """Return the number of the last row of a worksheet"""
+
+    @abstractmethod
+    def values(self, sheet: str, cells: "Set[str]") -> "Dict[str, Any]":
+        """Return the values of the given cells of a worksheet"""
+
+    @abstractmethod
+    def column_ranges(
+        self, sheet: str, starts: "Set[str]"
+    ) -> "Dict[str, List[Any]]":
+        """Return the values of the dataframe columns of a worksheet from
+        their start cells until its last row"""
+
+    def number_format(self, sheet: str, coordinate: str) -> str:
+        """Return the number format of a cell. Readers which do not read
+        the number formats return the general format."""
+        return "General"
+
+    def close(self) -> None:
+        """Close the workbook"""
+
+    def read(
+        self,
+        sheet: str,
+        cells: "Set[str]",
+        starts: "Set[str]",
+        number_formats: bool,
+    ) -> _SheetCells:
+        """Read the cells and dataframe columns of a worksheet. Number
+        formats are only read if requested."""
+        result = _SheetCells(self.max_row(sheet))
+        result.values.update(self.values(sheet, cells))
+        if number_formats:
+            for coordinate in cells:
+                result.number_formats[coordinate] = self.number_format(
+                    sheet, coordinate
+                )
+        for start, values in self.column_ranges(sheet, starts).items():
+            row, _ = coordinate_to_tuple(start)
+            result.max_row = max(result.max_row, row + len(values) - 1)
+            result.columns[start] = _to_array(values)
+        return result
+
+
+class _OpenpyxlReader(_WorkbookReader):
+    """Reader of the worksheets of an excel workbook with openpyxl, which
+    loads every cell of the worksheets into memory or streams their rows
+    in read-only mode"""
+
+    def __init__(
+        self, datafile: BytesIO, sheets: "Iterable[str]", read_only: bool
+    ) -> None:
+        self.workbook = _load_workbook(datafile, sheets, read_only)
+        self.read_only = read_only
+
+    def max_row(self, sheet: str) -> int:
+        # read-only worksheets without dimensions have no maximum row
+        return self.workbook[sheet].max_row or 0
+
+    def values(self, sheet: str, cells: "Set[str]") -> "Dict[str, Any]":
+        worksheet = self.workbook[sheet]
+        if not self.read_only:
+            return {
+                coordinate: worksheet[coordinate].value for coordinate in cells
+            }
+
+        # stream the rows only until the last referenced cell
+        by_row: "Dict[int, List[Tuple[int, str]]]" = {}
+        for coordinate in cells:
+            row, column = coordinate_to_tuple(coordinate)
+            by_row.setdefault(row, []).append((column, coordinate))
+        if not by_row:
+            return {}
+        max_col = max(column for row in by_row.values() for column, _ in row)
+        values = {}
+        for index, row in enumerate(
+            worksheet.iter_rows(
+                min_row=min(by_row),
+                max_row=max(by_row),
+                max_col=max_col,
+                values_only=True,
+            ),
+            start=min(by_row),
+        ):
+            for column, coordinate in by_row.get(index, []):
+                values[coordinate] = row[column - 1]
+        return values
+
+    def column_ranges(
+        self, sheet: str, starts: "Set[str]"
+    ) -> "Dict[str, List[Any]]":
+        if not starts:
+            return {}
+
+        # extract all dataframe columns in a single pass over their rows
+        columns = [(*coordinate_to_tuple(start), start) for start in starts]
+        min_row = min(row for row, _, _ in columns)
+        min_col = min(column for _, column, _ in columns)
+        max_col = max(column for _, column, _ in columns)
+        values = {start: [] for start in starts}
+        for index, row in enumerate(
+            self.workbook[sheet].iter_rows(
+                min_row=min_row,
+                min_col=min_col,
+                max_col=max_col,
+                values_only=True,
+            ),
+            start=min_row,
+        ):
+            for start_row, column, start in columns:
+                if index >= start_row:
+                    values[start].append(row[column - min_col])
+        return values
+
+    def number_format(self, sheet: str, coordinate: str) -> str:
+        return self.workbook[sheet][coordinate].number_format
+
+    def close(self) -> None:
+        self.workbook.close()
+
+
+def _calamine_value(value: Any) -> Any:
+    """Convert a value read by calamine into the value read by openpyxl.
+    Empty cells become None, integral numbers become integers and dates
+    become datetimes."""
+    if isinstance(value, str) and not value:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if type(value) is date:
+        return datetime.combine(value, time())
+    return value
+
+
+class _CalamineReader(_WorkbookReader):
+    """Reader of the worksheets of an excel workbook with calamine, which
+    also reads binary `.xlsb`, `.xls` and `.ods` workbooks. Number formats
+    of the cells are not available."""
+
+    def __init__(
+        self, datafile: BytesIO, sheets: "Iterable[str]", read_only: bool
+    ) -> None:
+        from python_calamine import CalamineWorkbook
+
+        workbook = CalamineWorkbook.from_filelike(datafile)
+        self.rows: "Dict[str, List[List[Any]]]" = {}
+        for name in sheets:
+            if name not in workbook.sheet_names:
+                raise KeyError(f"Worksheet {name} does not exist.")
+            self.rows[name] = workbook.get_sheet_by_name(name).to_python(
+                skip_empty_area=False
+            )
+        workbook.close()
+
+    def _value(self, sheet: str, row: int, column: int) -> Any:
+        rows = self.rows[sheet]
+        if row <= len(rows) and column <= len(rows[row - 1]):
+            return _calamine_value(rows[row - 1][column - 1])
+        return None
+
+    def max_row(self, sheet: str) -> int:
+        return len(self.rows[sheet])
+
+    def values(self, sheet: str, cells: "Set[str]") -> "Dict[str, Any]":
+        return {
+            coordinate: self._value(sheet, *coordinate_to_tuple(coordinate))
+            for coordinate in cells
+        }
+
+    def column_ranges(
+        self, sheet: str, starts: "Set[str]"
+    ) -> "Dict[str, List[Any]]":
+        values = {}
+        for start in starts:
+            row, column = coordinate_to_tuple(start)
+            values[start] = [
+                self._value(sheet, index, column)
+                for index in range(row, len(self.rows[sheet]) + 1)
+            ]
+        return values
+
+
+_READERS: "Dict[ExcelEngine, Type[_WorkbookReader]]" = {
+    ExcelEngine.OPENPYXL: _OpenpyxlReader,
+    ExcelEngine.CALAMINE: _CalamineReader,
+}
+
+
+def _read_sheet(
+    engine: ExcelEngine,
+    content: bytes,
+    name: str,
+    cells: "Set[str]",
+    starts: "Set[str]",
+    read_only: bool,
+    number_formats: bool,
+) -> _SheetCells:
+    """Load a single worksheet of an excel workbook and read its cells and
+    dataframe columns. Runs in a worker process."""
+    reader = _READERS[engine](BytesIO(content), [name], read_only)
+    try:
+        return reader.read(name, cells, starts, number_formats)
+    finally:
+        reader.close()
+
+
+def _read_sheets(
+    engine: ExcelEngine,
+    datafile: BytesIO,
+    plan: "Dict[str, Tuple[Set[str], Set[str]]]",
+    read_only: bool,
+    number_formats: bool,
+    max_workers: int,
+) -> "Dict[str, _SheetCells]":
+    """Read the cells and dataframe columns of the worksheets in the plan
+    with the reader of the engine. With more than one worker, the
+    worksheets are parsed concurrently in separate processes, each of them
+    loading only its own worksheet."""
+    if max_workers > 1 and len(plan) > 1:
+        content = datafile.getvalue()
+        with ProcessPoolExecutor(min(max_workers, len(plan))) as executor:
+            futures = {
+                name: executor.submit(
+                    _read_sheet,
+                    engine,
+                    content,
+                    name,
+                    cells,
+                    starts,
+                    read_only,
+                    number_formats,
+                )
+                for name, (cells, starts) in plan.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+    reader = _READERS[engine](datafile, plan, read_only)
+    datafile.seek(0)
+    try:
+        return {
+            name: reader.read(name, cells, starts, number_formats)
+            for name, (cells, starts) in plan.items()
+        }
+    finally:
+        reader.close()
+
+
 class ExcelTBoxParser(TBoxBaseParser):
     """
     Parses a data file of type excel in b box mode
@@ -57,6 +487,14 @@ class ExcelTBoxParser(TBoxBaseParser):
         1, description="Length of the header of the excel sheet", ge=1
     )
 
+    engine: Union[ExcelEngine, None] = Field(
+        None,
+        description="""Reader of the excel workbook. By default, the reader
+        is detected by pandas from the format of the workbook. The
+        `calamine` reader is faster and also reads `.xlsb`, `.xls` and
+        `.ods` workbooks, but requires `python-calamine` to be installed.""",
+    )
+
     # OVERRIDE
     mapping: Union[str, List[TBoxBaseMapping]] = Field(
         ...,
@@ -101,7 +539,11 @@ class ExcelTBoxParser(TBoxBaseParser):
         None
             This function does not return any value.
         """
-        df = pd.read_excel(datafile, sheet_name=self.sheet)
+        kwargs = {}
+        engine = _excel_engine(self)
+        if engine:
+            kwargs["engine"] = engine
+        df = pd.read_excel(datafile, sheet_name=self.sheet, **kwargs)
         _make_tbox_classes(self, df, mapping)
 
     # OVERRIDE
@@ -126,6 +568,32 @@ class ExcelABoxParser(ABoxBaseParser):
         description="Index where the marco for the unit in an excel cell might be located.",
     )
 
+    read_only: bool = Field(
+        False,
+        description="""Stream the worksheets in read-only mode instead of
+        loading every cell of the workbook into memory. Only the cells and
+        dataframe columns referenced by the mapping are read, in a single
+        pass over the rows of each worksheet.""",
+    )
+
+    max_workers: int = Field(
+        1,
+        description="""Number of processes in which the worksheets referenced
+        by the mapping are parsed concurrently. The results are merged in
+        the order of the mapping.""",
+        ge=1,
+    )
+
+    engine: ExcelEngine = Field(
+        ExcelEngine.OPENPYXL,
+        description="""Reader of the excel workbook. The `calamine` reader
+        is faster and also reads `.xlsb`, `.xls` and `.ods` workbooks,
+        but requires `python-calamine` to be installed. It does not read the
+        number formats of the cells and hence falls back to `openpyxl` if
+        `unit_from_macro` is enabled. `read_only` only applies to
+        `openpyxl`.""",
+    )
+
     # OVERRIDE
     mapping: Union[str, List[ABoxExcelMapping]] = Field(
         ...,
@@ -295,26 +763,38 @@ class ExcelABoxParser(ABoxBaseParser):
             None: This function does not return anything.
         """
 
-        workbook = load_workbook(filename=datafile, data_only=True)
-        datafile.seek(0)
-        macros = load_workbook(filename=datafile)
-        datafile.seek(0)
+        # only the worksheets referenced by the mapping are loaded and
+        # only the cells referenced by the mapping are read from them.
+        # the number formats of the cells, which hold the macros for the
+        # units, are also loaded with the cached values of the formulas
+        plan = _make_plan(mapping)
+        sheets = _read_sheets(
+            ExcelEngine(_excel_engine(self)),
+            datafile,
+            plan,
+            self.read_only,
+            self.unit_from_macro,
+            self.max_workers,
+        )
 
         self._general_metadata = []
         self._dataframe_metadata = []
         self._dataframe = {}
+        templates = {}
 
         for datum in mapping:
-            worksheet = workbook[datum.worksheet]
+            worksheet = sheets[datum.worksheet]
 
             if datum.suffix_from_location:
-                suffix = worksheet[datum.suffix].value
+                suffix = worksheet.value(datum.suffix)
                 if not suffix:
                     suffix = datum.suffix
-                    message = f"""Could not properly resolve suffix location `{datum.suffix}`
-                                  Will use the location itself as suffix.
-                                """
-                    warnings.warn(message, MappingMissmatchWarning)
+                    report(
+                        MappingMissmatchWarning,
+                        datum.key,
+                        datum.suffix,
+                        _unresolved_suffix_message,
+                    )
             else:
                 suffix = datum.suffix
             suffix = quote(suffix)
@@ -328,28 +808,25 @@ class ExcelABoxParser(ABoxBaseParser):
 
                 # find data for dataframe
                 if datum.dataframe_start:
-                    column_name = datum.dataframe_start.rstrip("0123456789")
-                    dataframe_end = f"{column_name}{worksheet.max_row}"
-
-                    column = worksheet[datum.dataframe_start : dataframe_end]
-                    if column:
-                        self._dataframe[suffix] = [
-                            cell[0].value for cell in column
-                        ]
+                    column = worksheet.column(datum.dataframe_start)
+                    if len(column):
+                        self._dataframe[suffix] = column
                     else:
-                        message = f"""Concept with key `{datum.key}`
-                                    does not have a dataframe from `{datum.dataframe_start}`
-                                    until `{dataframe_end}` .
-                                    Concept will be omitted in graph.
-                                    """
-                        warnings.warn(message, MappingMissmatchWarning)
+                        report(
+                            MappingMissmatchWarning,
+                            datum.key,
+                            datum.dataframe_start,
+                            partial(
+                                _missing_dataframe_message,
+                                max_row=worksheet.max_row,
+                            ),
+                        )
 
                 # check if there is a macro for the unit of the entity
                 if self.unit_from_macro and datum.value_location:
-                    macro_worksheet = macros[datum.worksheet]
-                    macro_value_cell = macro_worksheet[
+                    macro_value_cell = worksheet.number_format(
                         datum.value_location
-                    ].number_format.split()
+                    ).split()
                     if len(macro_value_cell) != 1:
                         macro_unit = macro_value_cell[self.unit_macro_location]
                     else:
@@ -359,13 +836,14 @@ class ExcelABoxParser(ABoxBaseParser):
 
                 # check if there is a unit somewhere in the sheet
                 if datum.unit_location:
-                    unit_location = worksheet[datum.unit_location].value
+                    unit_location = worksheet.value(datum.unit_location)
                     if not unit_location:
-                        message = f"""Concept with key `{datum.key}`
-                                    does not have a unit at location `{datum.unit_location}`.
-                                    This mapping for the unit will be omitted in graph.
-                                    """
-                        warnings.warn(message, MappingMissmatchWarning)
+                        report(
+                            MappingMissmatchWarning,
+                            datum.key,
+                            datum.unit_location,
+                            _missing_unit_message,
+                        )
                 else:
                     unit_location = None
 
@@ -390,18 +868,19 @@ class ExcelABoxParser(ABoxBaseParser):
                 }
 
                 if datum.value_location and not datum.dataframe_start:
-                    value = worksheet[datum.value_location].value
+                    value = worksheet.value(datum.value_location)
 
                     if model_data.get("unit") and _value_exists(value):
                         model_data["value"] = value
                     elif not model_data.get("unit") and _value_exists(value):
                         model_data["value"] = str(value)
                     else:
-                        message = f"""Concept with key `{datum.key}`
-                                    does not have a value at location `{datum.value_location}`.
-                                    Concept will be omitted in graph.
-                                    """
-                        warnings.warn(message, MappingMissmatchWarning)
+                        report(
+                            MappingMissmatchWarning,
+                            datum.key,
+                            datum.value_location,
+                            _missing_value_message,
+                        )
                 else:
                     value = None
 
@@ -413,9 +892,13 @@ class ExcelABoxParser(ABoxBaseParser):
                     if model_data.get("unit"):
                         if datum.unit_relation:
                             model_data["unit_relation"] = datum.unit_relation
-                        model = QuantityGraph(**model_data)
+                        model = _make_graph(
+                            QuantityGraph, templates, **model_data
+                        )
                     else:
-                        model = PropertyGraph(
+                        model = _make_graph(
+                            PropertyGraph,
+                            templates,
                             **model_data,
                             value_datatype=datum.value_datatype,
                             value_relation_type=datum.value_relation_type,
@@ -428,7 +911,7 @@ class ExcelABoxParser(ABoxBaseParser):
 
             else:
                 for relation in datum.custom_relations:
-                    value = worksheet[relation.object_location].value
+                    value = worksheet.value(relation.object_location)
 
                     if isinstance(
                         relation.object_data_type,
@@ -459,7 +942,9 @@ class ExcelABoxParser(ABoxBaseParser):
                         )
                         self._general_metadata.append(model)
                     elif _value_exists(value):
-                        model = PropertyGraph(
+                        model = _make_graph(
+                            PropertyGraph,
+                            templates,
                             value_relation=relation.relation,
                             value_relation_type=relation.relation_type,
                             value_datatype=relation.object_data_type,
@@ -470,16 +955,15 @@ class ExcelABoxParser(ABoxBaseParser):
                         )
                         self._general_metadata.append(model)
                     else:
-                        message = f"""Concept with for iri `{datum.iri}`
-                                        does not have a value at location `{relation.object_location}`.
-                                        Concept will be omitted in graph.
-                                        """
-                        warnings.warn(message, MappingMissmatchWarning)
+                        report(
+                            MappingMissmatchWarning,
+                            datum.iri,
+                            relation.object_location,
+                            _missing_iri_value_message,
+                        )
 
         # set dataframe as pd dataframe
-        self._dataframe = pd.DataFrame.from_dict(
-            self._dataframe, orient="index"
-        ).transpose()
+        self._dataframe = _make_dataframe(self._dataframe)
         # check if drop na:
         if self.dropna:
             self._dataframe.dropna(how="all", inplace=True)
@@ -2,21 +2,36 @@
 
 import json
 import os
-import warnings
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache, partial
+from io import BytesIO, IOBase, StringIO, TextIOBase, TextIOWrapper
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import quote, urljoin
 
+import numpy as np
 import pandas as pd
 from jsonpath_ng import parse
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
-from data2rdf.models.graph import PropertyGraph, QuantityGraph
+from data2rdf.diagnostics import report
+from data2rdf.models.graph import PropertyGraph, QuantityGraph, _make_graphs
 from data2rdf.models.mapping import (
     CustomRelationPropertySubgraph,
     CustomRelationQuantitySubgraph,
 )
+from data2rdf.stats import stage
 from data2rdf.utils import make_prefix
-from data2rdf.warnings import MappingMissmatchWarning
+from data2rdf.warnings import MappingMissmatchWarning, ParserWarning
 
 from .utils import _value_exists
 
@@ -26,10 +41,22 @@ from data2rdf.parsers.base import (  # isort:skip
     TBoxBaseParser,
 )
 from data2rdf.parsers.utils import (  # isort:skip
+    _decompress,
     _make_tbox_classes,
     _make_tbox_json_ld,
     _strip_unit,
     _check_jsonpath,
+    _compile_simple_jsonpath,
+    _find_simple_jsonpath,
+    _find_simple_jsonpaths,
+    _load_json_paths,
+    _make_jsonpath_trie,
+    _missing_concept_unit_message,
+    _missing_iri_value_message,
+    _missing_value_message,
+    _multiple_units_message,
+    _unresolved_source_message,
+    _unresolved_suffix_message,
 )
 
 from data2rdf.models.mapping import (  # isort:skip
@@ -38,27 +65,120 @@ from data2rdf.models.mapping import (  # isort:skip
     TBoxBaseMapping,
 )
 
+if TYPE_CHECKING:
+    from jsonpath_ng import JSONPath
+
+# types of the values of series, including the numpy arrays of numbers
+# read while streaming
+_SERIES = (list, np.ndarray)
+
+
+@lru_cache(maxsize=1024)
+def _compile_jsonpath(path: str) -> "JSONPath":
+    """Compile a jsonpath expression. Each distinct expression is only
+    parsed once and reused for all objects and files it is applied to."""
+    return parse(path)
+
+
+def _find_values(path: str, data: Any) -> List[Any]:
+    """Return the values matching a jsonpath expression in the data.
+    Simple expressions are evaluated by walking the data directly, while
+    all others, e.g. with filters or recursive descent, are evaluated by
+    jsonpath_ng."""
+    steps = _compile_simple_jsonpath(path)
+    if steps is None:
+        return [match.value for match in _compile_jsonpath(path).find(data)]
+    return _find_simple_jsonpath(steps, data)
+
+
+def _document_paths(mapping: "List[ABoxBaseMapping]") -> "Tuple[str, ...]":
+    """Collect the jsonpath expressions of the mapping, which are evaluated
+    against the whole document"""
+    paths = {}
+    for datum in mapping:
+        if not datum.custom_relations:
+            locations = [datum.value_location, datum.unit_location]
+        elif datum.source:
+            locations = [datum.source]
+        else:
+            locations = [
+                relation.object_location for relation in datum.custom_relations
+            ]
+        if datum.suffix_from_location and not datum.source:
+            locations.append(datum.suffix)
+        for location in locations:
+            if location:
+                paths[_check_jsonpath(location)] = None
+    return tuple(paths)
+
+
+def _array_paths(mapping: "List[ABoxBaseMapping]") -> "FrozenSet[str]":
+    """Collect the value locations of the mapping, which point to a single
+    value of the document that is not used for anything else"""
+    arrays = set()
+    others = set()
+    for datum in mapping:
+        if datum.custom_relations:
+            others.update(_document_paths([datum]))
+            continue
+        path = _check_jsonpath(datum.value_location)
+        steps = _compile_simple_jsonpath(path)
+        if steps and all(
+            kind in ("root", "field", "index") for kind, _ in steps
+        ):
+            arrays.add(path)
+        if datum.unit_location:
+            others.add(_check_jsonpath(datum.unit_location))
+        if datum.suffix_from_location:
+            others.add(_check_jsonpath(datum.suffix))
+    return frozenset(arrays - others)
+
 
 def _load_data_file(
     self: "Union[JsonABoxParser, JsonTBoxParser]",
+    load: "Callable[[IO[str]], Any]" = json.load,
 ) -> "List[Dict[str, Any]]":
-    """Load json file"""
+    """Load json file. Compressed files and streams are decompressed
+    on the fly."""
     if isinstance(self.raw_data, str):
         if os.path.isfile(self.raw_data):
-            with open(self.raw_data, encoding=self.config.encoding) as file:
-                content = json.load(file)
+            with open(self.raw_data, mode="rb") as file:
+                content = _load_stream(self, file, load)
         else:
-            content = json.loads(self.raw_data)
+            content = load(StringIO(self.raw_data))
 
+    if isinstance(self.raw_data, bytes):
+        content = _load_stream(self, BytesIO(self.raw_data), load)
+    if isinstance(self.raw_data, IOBase):
+        content = _load_stream(self, self.raw_data, load)
     if isinstance(self.raw_data, (list, dict)):
         content = self.raw_data
-    if not isinstance(self.raw_data, (str, dict, list)):
+    if not isinstance(self.raw_data, (str, bytes, dict, list, IOBase)):
         raise TypeError(
-            "Raw data must be of type `str` for a file path or a `dict` for a parsed json."
+            "Raw data must be of type `str` for a file path, `bytes`, a file object or a `dict` for a parsed json."
         )
     return content
 
 
+def _load_stream(
+    self: "Union[JsonABoxParser, JsonTBoxParser]",
+    stream: "IO",
+    load: "Callable[[IO[str]], Any]" = json.load,
+) -> "Union[List[Dict[str, Any]], Dict[str, Any]]":
+    """Load json from a text or binary stream from its beginning"""
+    if stream.seekable():
+        stream.seek(0)
+    stream = _decompress(stream)
+    if isinstance(stream, TextIOBase):
+        return load(stream)
+    text = TextIOWrapper(stream, encoding=self.config.encoding)
+    try:
+        return load(text)
+    finally:
+        # do not close the underlying stream of the raw data
+        text.detach()
+
+
 class JsonTBoxParser(TBoxBaseParser):
     """Parser for JSON in TBox mode"""
 
@@ -126,6 +246,17 @@ class JsonABoxParser(ABoxBaseParser):
         will be iterated so that the mapping will be applied to each element of the array.""",
     )
 
+    streaming: bool = Field(
+        False,
+        description="""Read the json document incrementally instead of
+        loading it as a whole. Only the values referenced by the mapping are
+        decoded, while the rest of the document is skipped, and arrays of
+        numbers for the dataframe are read into numpy arrays.""",
+    )
+
+    _document: Any = PrivateAttr(None)
+    _located: Dict[str, List[Any]] = PrivateAttr(default_factory=dict)
+
     # OVERRIDE
     @property
     def mapping_model(self) -> ABoxBaseMapping:
@@ -261,6 +392,10 @@ class JsonABoxParser(ABoxBaseParser):
         Returns:
             Dict[str, Any]: The loaded data file.
         """
+        if self.streaming:
+            # the document is read in `_run_parser`, where the paths of
+            # the mapping are known
+            return None
         return _load_data_file(self)
 
     # OVERRIDE
@@ -287,56 +422,64 @@ class JsonABoxParser(ABoxBaseParser):
         self._general_metadata = []
         self._dataframe_metadata = []
         self._dataframe = {}
+
+        if self.streaming:
+            datafile = self._stream_data_file(mapping)
+
+        # the paths evaluated against the whole document are resolved
+        # at once in a single traversal of the document
+        self._document = datafile
+        trie = _make_jsonpath_trie(_document_paths(mapping))
+        self._located = _find_simple_jsonpaths(trie, datafile)
+
         for datum in mapping:
             subdataset = self._get_optional_subdataset(datafile, datum)
 
             if not datum.custom_relations:
                 suffix = self._make_suffix_from_location(datum, subdataset)
                 path = _check_jsonpath(datum.value_location)
-                value_expression = parse(path)
-
-                results = [
-                    match.value for match in value_expression.find(subdataset)
-                ]
+                results = self._find_values(path, subdataset)
 
                 if len(results) == 0:
                     value = None
-                    message = f"""Concept with key `{datum.key or path}`
-                                    does not have a value at location `{path}`.
-                                    Concept will be omitted in graph.
-                                    """
-                    warnings.warn(message, MappingMissmatchWarning)
+                    report(
+                        MappingMissmatchWarning,
+                        datum.key or path,
+                        path,
+                        _missing_value_message,
+                    )
                 elif len(results) == 1:
                     value = results.pop()
                 else:
                     value = results
 
-                if isinstance(value, list) or _value_exists(value):
+                if isinstance(value, _SERIES) or _value_exists(value):
                     if datum.unit_location:
                         path_unit_location = _check_jsonpath(
                             datum.unit_location
                         )
-                        unit_expression = parse(path_unit_location)
-
-                        results = [
-                            match.value
-                            for match in unit_expression.find(subdataset)
-                        ]
+                        results = self._find_values(
+                            path_unit_location, subdataset
+                        )
 
                         if len(results) == 0:
                             unit = None
-                            message = f"""Concept with key `{datum.key or path_unit_location}`
-                                            does not have a unit at location `{path_unit_location}`.
-                                            Concept will be omitted in graph."""
-                            warnings.warn(message, MappingMissmatchWarning)
+                            report(
+                                MappingMissmatchWarning,
+                                datum.key or path_unit_location,
+                                path_unit_location,
+                                _missing_concept_unit_message,
+                            )
                         elif len(results) == 1:
                             unit = results.pop()
                         else:
                             unit = None
-                            message = f"""Concept with key `{datum.key or path_unit_location}`
-                                        has multiple units at location `{path_unit_location}`.
-                                        Concept will be omitted in graph."""
-                            warnings.warn(message, MappingMissmatchWarning)
+                            report(
+                                MappingMissmatchWarning,
+                                datum.key or path_unit_location,
+                                path_unit_location,
+                                _multiple_units_message,
+                            )
 
                     else:
                         unit = None
@@ -367,7 +510,7 @@ class JsonABoxParser(ABoxBaseParser):
                     # * add the graph to the dataframe metadata
                     # * add the values of the series to the dataframe array
                     if (
-                        isinstance(value, list)
+                        isinstance(value, _SERIES)
                         and unit
                         and not self.expand_array
                     ):
@@ -388,15 +531,15 @@ class JsonABoxParser(ABoxBaseParser):
                         model_data["unit"] = unit
                         if datum.unit_relation:
                             model_data["unit_relation"] = datum.unit_relation
-                        for val in value:
-                            model = QuantityGraph(**model_data, value=val)
-                            self._general_metadata.append(model)
+                        self._general_metadata.extend(
+                            _make_graphs(QuantityGraph, value, **model_data)
+                        )
                     # if we have a series and *no* unit and we are *not* expanding:
                     # * make a PropertyGraph
                     # * add the graph to the dataframe metadata
                     # * add the values of the series to the dataframe array
                     elif (
-                        isinstance(value, list)
+                        isinstance(value, _SERIES)
                         and not unit
                         and not self.expand_array
                     ):
@@ -415,14 +558,15 @@ class JsonABoxParser(ABoxBaseParser):
                         and not unit
                         and self.expand_array
                     ):
-                        for val in value:
-                            model = PropertyGraph(
-                                value=val,
+                        self._general_metadata.extend(
+                            _make_graphs(
+                                PropertyGraph,
+                                value,
                                 value_relation_type=datum.value_relation_type,
                                 value_datatype=datum.value_datatype,
                                 **model_data,
                             )
-                            self._general_metadata.append(model)
+                        )
                     # if we do *not* have a series but have a unit:
                     # * make a QuantityGraph with the unit and the value
                     # * add the graph to the general metadata
@@ -471,6 +615,9 @@ class JsonABoxParser(ABoxBaseParser):
                             relation, subdataset, datum, suffix
                         )
 
+        self._document = None
+        self._located = {}
+
         # set dataframe as pd dataframe
         self._dataframe = pd.DataFrame.from_dict(
             self._dataframe, orient="index"
@@ -479,19 +626,48 @@ class JsonABoxParser(ABoxBaseParser):
         if self.dropna:
             self._dataframe.dropna(how="all", inplace=True)
 
+    def _stream_data_file(self, mapping: "List[ABoxBaseMapping]") -> Any:
+        """Read the values of the document needed by the mapping. Falls
+        back to loading the whole document if any of the paths cannot be
+        resolved while reading."""
+        paths = _document_paths(mapping)
+        complex_paths = [
+            path for path in paths if _compile_simple_jsonpath(path) is None
+        ]
+        if complex_paths:
+            report(
+                ParserWarning,
+                "streaming",
+                message=f"The jsonpath expressions {complex_paths} cannot be resolved while streaming. Falling back to loading the whole document.",
+            )
+            return _load_data_file(self)
+        arrays = frozenset() if self.expand_array else _array_paths(mapping)
+        with stage("stream_data_file"):
+            load = partial(_load_json_paths, expressions=paths, arrays=arrays)
+            return _load_data_file(self, load)
+
+    def _find_values(self, path: str, data: Any) -> List[Any]:
+        """Return the values matching a jsonpath expression in the data.
+        The values of the paths in the whole document are looked up from
+        the traversal of the document."""
+        if data is self._document and path in self._located:
+            return list(self._located[path])
+        return _find_values(path, data)
+
     def _get_optional_subdataset(
         self, datafile: Any, datum: ABoxBaseMapping
     ) -> Any:
         subdataset = None
         if datum.custom_relations and datum.source:
             path_source = _check_jsonpath(datum.source)
-            value_expression = parse(path_source)
-            results = [
-                match.value for match in value_expression.find(datafile)
-            ]
+            results = self._find_values(path_source, datafile)
             if len(results) == 0:
-                message = f"""Could not properly resolve location `{path_source}` for curstom relations."""
-                warnings.warn(message, MappingMissmatchWarning)
+                report(
+                    MappingMissmatchWarning,
+                    datum.key or path_source,
+                    path_source,
+                    _unresolved_source_message,
+                )
             else:
                 subdataset = results
         else:
@@ -506,17 +682,16 @@ class JsonABoxParser(ABoxBaseParser):
         suffix: str,
     ) -> None:
         path_object_location = _check_jsonpath(relation.object_location)
-        value_expression = parse(path_object_location)
-
-        results = [match.value for match in value_expression.find(subdataset)]
+        results = self._find_values(path_object_location, subdataset)
 
         if len(results) == 0:
             value = None
-            message = f"""Concept with for iri `{datum.iri}`
-                            does not have a value at location `{path_object_location}`.
-                            Concept will be omitted in graph.
-                            """
-            warnings.warn(message, MappingMissmatchWarning)
+            report(
+                MappingMissmatchWarning,
+                datum.iri,
+                path_object_location,
+                _missing_iri_value_message,
+            )
         elif len(results) == 1:
             value = results.pop()
         else:
@@ -532,11 +707,12 @@ class JsonABoxParser(ABoxBaseParser):
             elif _value_exists(value):
                 self._make_subgraph(relation, datum, value, suffix)
             else:
-                message = f"""Concept with for iri `{datum.iri}`
-                                does not have a value at location `{relation.object_location}`.
-                                Concept will be omitted in graph.
-                                """
-                warnings.warn(message, MappingMissmatchWarning)
+                report(
+                    MappingMissmatchWarning,
+                    datum.iri,
+                    relation.object_location,
+                    _missing_iri_value_message,
+                )
 
         else:
             if isinstance(value, list):
@@ -555,11 +731,12 @@ class JsonABoxParser(ABoxBaseParser):
                     **relation.model_dump(exclude={"object_location"}),
                 )
             else:
-                message = f"""Concept with for iri `{datum.iri}`
-                                does not have a value at location `{relation.object_location}`.
-                                Concept will be omitted in graph.
-                                """
-                warnings.warn(message, MappingMissmatchWarning)
+                report(
+                    MappingMissmatchWarning,
+                    datum.iri,
+                    relation.object_location,
+                    _missing_iri_value_message,
+                )
 
     def _make_subgraph(
         self,
@@ -623,17 +800,16 @@ class JsonABoxParser(ABoxBaseParser):
     ) -> str:
         if datum.suffix_from_location:
             path_suffix = _check_jsonpath(datum.suffix)
-            value_expression = parse(path_suffix)
-            results = [
-                match.value for match in value_expression.find(subdataset)
-            ]
+            results = self._find_values(path_suffix, subdataset)
 
             if len(results) == 0 or len(results) > 1:
                 suffix = path_suffix
-                message = f"""Could not properly resolve suffix location `{path_suffix}`
-                                Will use the location itself as suffix.
-                            """
-                warnings.warn(message, MappingMissmatchWarning)
+                report(
+                    MappingMissmatchWarning,
+                    datum.key or path_suffix,
+                    path_suffix,
+                    _unresolved_suffix_message,
+                )
             else:
                 suffix = results.pop()
         else:
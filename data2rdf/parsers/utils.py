@@ -1,14 +1,19 @@
 """Data2RDF parser utilities"""
 
+import bz2
+import gzip
 import json
+import lzma
 import re
-import warnings
+from functools import lru_cache
+from io import BufferedReader, TextIOBase
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
 
 from data2rdf import Config
+from data2rdf.diagnostics import report
 from data2rdf.models.graph import ClassTypeGraph
 from data2rdf.warnings import MappingMissmatchWarning
 
@@ -18,8 +23,43 @@ from data2rdf.models.mapping import (  # isort:skip
 
 ALLOW_PATTERN = r"[^a-zA-Z0-9\-._$[*\[\]]*"
 
+# the subset of jsonpath evaluated without jsonpath_ng: an optional root,
+# fields separated by dots, which are plain, quoted or wildcards, and
+# integer indices or wildcards in brackets
+_SIMPLE_FIELD = r'(?:[a-zA-Z_][a-zA-Z0-9_\-]*|\*|"[^"\\]*")'
+_SIMPLE_STEP = r"(?:\[(?:\d+|\*)\])"
+SIMPLE_JSONPATH = re.compile(
+    rf"(?:\$|{_SIMPLE_FIELD}){_SIMPLE_STEP}*"
+    rf"(?:\.{_SIMPLE_FIELD}{_SIMPLE_STEP}*)*"
+)
+_SIMPLE_TOKEN = re.compile(rf"^\$|{_SIMPLE_FIELD}|{_SIMPLE_STEP}")
+_NOT_SET = object()
+
+# tokens of the incremental json reader
+_JSON_CHUNK_SIZE = 1 << 16
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_NUMBER = r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?"
+_JSON_SCALAR = re.compile(
+    rf"(?:{_JSON_NUMBER}|true|false|null|NaN|-?Infinity)(?=[ \t\n\r,\]}}]|$)"
+)
+_JSON_NUMBERS = re.compile(rf"(?:[ \t\n\r]*{_JSON_NUMBER}[ \t\n\r]*,)+")
+_JSON_INTEGER = re.compile(r"(?:^|,)[ \t\n\r]*-?\d+[ \t\n\r]*(?:,|$)")
+_JSON_STRING_END = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+_JSON_STRUCTURE = re.compile(r'["\[\]{}]')
+
 if TYPE_CHECKING:
-    from typing import Any, Dict, List, Union
+    from typing import (
+        IO,
+        AbstractSet,
+        Any,
+        Callable,
+        Dict,
+        List,
+        Optional,
+        Pattern,
+        Tuple,
+        Union,
+    )
 
     from data2rdf.models.mapping import TBoxBaseMapping
     from data2rdf.parsers.base import TBoxBaseParser
@@ -89,78 +129,210 @@ def load_mapping_file(
     return result
 
 
+def _open_zstd(stream: "IO[bytes]") -> "IO[bytes]":
+    """Return a buffered reader decompressing a zstd stream. The reader
+    of zstandard itself does not support reading lines."""
+    try:
+        import zstandard
+    except ImportError as error:
+        raise ImportError(
+            """The raw data is compressed with zstd. Please install
+            `zstandard`, e.g. with `pip install data2rdf[zstd]`."""
+        ) from error
+    return BufferedReader(
+        zstandard.ZstdDecompressor().stream_reader(stream, closefd=False)
+    )
+
+
+# magic numbers at the start of compressed data and the decompressing
+# readers. The readers do not close the streams they are reading from.
+# A bz2 stream starts with its block size and the magic number of either
+# its first block or, if it is empty, of its end.
+COMPRESSIONS: "Dict[Pattern[bytes], Callable[[IO[bytes]], IO[bytes]]]" = {
+    re.compile(rb"\x1f\x8b"): lambda stream: gzip.GzipFile(fileobj=stream),
+    re.compile(rb"BZh[1-9](?:1AY&SY|\x17rE8P\x90)"): bz2.BZ2File,
+    re.compile(rb"\xfd7zXZ\x00"): lzma.LZMAFile,
+    re.compile(rb"\x28\xb5\x2f\xfd"): _open_zstd,
+}
+_COMPRESSION_HEAD = 10
+
+
+def _decompress(stream: "IO") -> "IO":
+    """Wrap a binary stream into a reader which decompresses it on the fly,
+    if it starts with the magic number of a gzip, bz2, xz or zstd
+    compression. Text streams, uncompressed streams and streams whose
+    start cannot be read without consuming it are returned unchanged."""
+    if isinstance(stream, TextIOBase):
+        return stream
+    if hasattr(stream, "peek"):
+        head = stream.peek(_COMPRESSION_HEAD)[:_COMPRESSION_HEAD]
+    elif stream.seekable():
+        position = stream.tell()
+        head = stream.read(_COMPRESSION_HEAD)
+        stream.seek(position)
+    else:
+        return stream
+    if not isinstance(head, bytes):
+        return stream
+    for magic, reader in COMPRESSIONS.items():
+        if magic.match(head):
+            return reader(stream)
+    return stream
+
+
 def _strip_unit(symbol: str, char_list: "List[str]") -> str:
     for char in char_list:
         symbol = symbol.strip(char)
     return symbol
 
 
+def _missing_data_message(key: str, row: "Any") -> str:
+    return f"Data for key `{key}` does not exist in row {row}."
+
+
+def _unmatched_key_message(key: "Any", location: "Any") -> str:
+    return f"No match found in mapping for key `{key}`"
+
+
+def _unmatched_keys_message(keys: "Any", location: "Any") -> str:
+    return "No match found in mapping for keys " + ", ".join(
+        f"`{key}`" for key in keys
+    )
+
+
+def _missing_value_message(key: "Any", location: "Any") -> str:
+    return f"""Concept with key `{key}`
+        does not have a value at location `{location}`.
+        Concept will be omitted in graph."""
+
+
+def _missing_iri_value_message(iri: "Any", location: "Any") -> str:
+    return f"""Concept with for iri `{iri}`
+        does not have a value at location `{location}`.
+        Concept will be omitted in graph."""
+
+
+def _missing_unit_message(key: "Any", location: "Any") -> str:
+    return f"""Concept with key `{key}`
+        does not have a unit at location `{location}`.
+        This mapping for the unit will be omitted in graph."""
+
+
+def _missing_concept_unit_message(key: "Any", location: "Any") -> str:
+    return f"""Concept with key `{key}`
+        does not have a unit at location `{location}`.
+        Concept will be omitted in graph."""
+
+
+def _multiple_units_message(key: "Any", location: "Any") -> str:
+    return f"""Concept with key `{key}`
+        has multiple units at location `{location}`.
+        Concept will be omitted in graph."""
+
+
+def _missing_dataframe_message(
+    key: "Any", location: "Any", max_row: int
+) -> str:
+    column = location.rstrip("0123456789")
+    return f"""Concept with key `{key}`
+        does not have a dataframe from `{location}`
+        until `{column}{max_row}` .
+        Concept will be omitted in graph."""
+
+
+def _unresolved_suffix_message(key: "Any", location: "Any") -> str:
+    return f"""Could not properly resolve suffix location `{location}`
+        Will use the location itself as suffix."""
+
+
+def _unresolved_source_message(key: "Any", location: "Any") -> str:
+    return f"Could not properly resolve location `{location}` for curstom relations."
+
+
+def _column_values(self: "TBoxBaseParser", column: "pd.Series") -> "List":
+    """Return the values of a column as python objects.
+    NaN values are replaced by the `fillna` value of the parser."""
+    values = column.tolist()
+    missing = column.isna().to_numpy()
+    if missing.any():
+        values = [
+            self.fillna if is_missing and isinstance(value, float) else value
+            for value, is_missing in zip(values, missing)
+        ]
+    return values
+
+
 def _make_tbox_classes(
     self: "TBoxBaseParser",
     df: "pd.DataFrame",
     mapping: "List[TBoxBaseMapping]",
 ) -> None:
+    """Make the class models of the rows of the dataframe.
+
+    The values are taken column-wise from the dataframe as python objects,
+    instead of iterating over the rows as series."""
     self._classes = []
     mapping = {model.key: model for model in mapping}
     if hasattr(self, "header_length"):
         skipped = df[self.header_length - 1 :]
     else:
         skipped = df
-    for n, row in skipped.iterrows():
-        annotations = []
-        datatypes = []
-        objects = []
-        properties = []
+    rows = skipped.index.tolist()
 
-        for key, model in mapping.items():
-            try:
-                value = row[key]
-                if isinstance(value, float) and np.isnan(value):
-                    value = self.fillna
-                if value:
-                    relation_mapping = {
+    # values of the mapped columns
+    columns = []
+    for key, model in mapping.items():
+        if key in skipped.columns:
+            values = _column_values(self, skipped[key])
+        else:
+            values = [None] * len(rows)
+        columns.append((key, model, values))
+
+    suffixes = skipped[self.suffix_location].tolist()
+    if self.rdfs_type_location:
+        rdfs_types = skipped[self.rdfs_type_location].tolist()
+    else:
+        rdfs_types = ["owl:Class"] * len(rows)
+
+    for index, n in enumerate(rows):
+        properties = {relation_type: [] for relation_type in RelationType}
+        for key, model, values in columns:
+            value = values[index]
+            if value:
+                properties[model.relation_type].append(
+                    {
                         "value": value,
                         "relation": model.relation,
                         "datatype": model.datatype,
                     }
-                    if model.relation_type == RelationType.ANNOTATION_PROPERTY:
-                        annotations.append(relation_mapping)
-                    if model.relation_type == RelationType.DATA_PROPERTY:
-                        datatypes.append(relation_mapping)
-                    if model.relation_type == RelationType.OBJECT_PROPERTY:
-                        objects.append(relation_mapping)
-                    if model.relation_type == RelationType.PROPERTY:
-                        properties.append(relation_mapping)
-                else:
-                    warnings.warn(
-                        f"Data for key `{key}` does not exist in row {n}.",
-                        MappingMissmatchWarning,
-                    )
-            except KeyError:
-                warnings.warn(
-                    f"Data for key `{key}` does not exist in row {n}.",
-                    MappingMissmatchWarning,
                 )
-
-        if self.rdfs_type_location:
-            rdfs_type = row[self.rdfs_type_location]
-            if isinstance(rdfs_type, type(None)) or (
-                isinstance(rdfs_type, float) and np.isnan(rdfs_type)
-            ):
-                warnings.warn(
-                    f"Data for key `{self.rdfs_type_location}` does not exist in row {n}.",
+            else:
+                report(
                     MappingMissmatchWarning,
+                    key,
+                    n,
+                    _missing_data_message,
                 )
-                rdfs_type = "owl:Class"
-        else:
+
+        rdfs_type = rdfs_types[index]
+        if isinstance(rdfs_type, type(None)) or (
+            isinstance(rdfs_type, float) and np.isnan(rdfs_type)
+        ):
+            report(
+                MappingMissmatchWarning,
+                self.rdfs_type_location,
+                n,
+                _missing_data_message,
+            )
             rdfs_type = "owl:Class"
+
         subgraph = ClassTypeGraph(
             rdfs_type=rdfs_type,
-            suffix=row[self.suffix_location],
-            annotation_properties=annotations,
-            object_properties=objects,
-            data_properties=datatypes,
-            rdfs_properties=properties,
+            suffix=suffixes[index],
+            annotation_properties=properties[RelationType.ANNOTATION_PROPERTY],
+            object_properties=properties[RelationType.OBJECT_PROPERTY],
+            data_properties=properties[RelationType.DATA_PROPERTY],
+            rdfs_properties=properties[RelationType.PROPERTY],
             config=self.config,
         )
         self._classes.append(subgraph)
@@ -248,3 +420,436 @@ def _check_jsonpath(expression):
         splitted = expression.split(".")
         expression = ".".join([f'"{exp}"' for exp in splitted])
     return expression
+
+
+@lru_cache(maxsize=1024)
+def _compile_simple_jsonpath(expression: str) -> "Optional[List[tuple]]":
+    """
+    Compiles a JSONPath expression of the simple subset into its steps.
+
+    The subset consists of an optional root `$`, plain, quoted or wildcard
+    fields separated by dots, as well as integer indices and wildcards in
+    brackets, e.g. `$.a.b`, `$.a[0].b` or `$.data[*].x`.
+
+    Args:
+        expression (str): The JSONPath expression, as adjusted by
+            `_check_jsonpath`.
+
+    Returns:
+        Optional[List[tuple]]: The steps of the expression, or None if the
+            expression is not part of the subset, e.g. for filters or
+            recursive descent.
+    """
+    if not SIMPLE_JSONPATH.fullmatch(expression):
+        return None
+    steps = []
+    for token in _SIMPLE_TOKEN.findall(expression):
+        if token == "$":
+            steps.append(("root", None))
+        elif token.strip('"') == "*":
+            steps.append(("fields", None))
+        elif token == "[*]":
+            steps.append(("slice", None))
+        elif token.startswith("["):
+            steps.append(("index", int(token[1:-1])))
+        elif token == "where":
+            # reserved word of the jsonpath grammar
+            return None
+        else:
+            steps.append(("field", token.strip('"')))
+    return steps
+
+
+def _find_simple_jsonpath(steps: "List[tuple]", data: "Any") -> "List[Any]":
+    """
+    Finds the values matching the compiled steps of a simple JSONPath
+    expression by walking the data directly.
+
+    The matches are the same and in the same order as the ones of
+    `jsonpath_ng`, including its handling of missing keys, indices out of
+    range and wildcards over single values.
+
+    Args:
+        steps (List[tuple]): The steps compiled by `_compile_simple_jsonpath`.
+        data (Any): The data to be searched.
+
+    Returns:
+        List[Any]: The matching values.
+    """
+    values = [data]
+    for step in steps:
+        values = _apply_simple_step(step, values, data)
+    return values
+
+
+def _apply_simple_step(
+    step: tuple, values: "List[Any]", data: "Any"
+) -> "List[Any]":
+    """Apply a step of a simple JSONPath expression to the values matched
+    by the previous steps"""
+    kind, argument = step
+    matches = []
+    for value in values:
+        if kind == "root":
+            matches.append(data)
+        elif kind == "field":
+            try:
+                match = value.get(argument, _NOT_SET)
+            except (TypeError, AttributeError):
+                continue
+            if match is not _NOT_SET:
+                matches.append(match)
+        elif kind == "fields":
+            try:
+                keys = tuple(value.keys())
+            except AttributeError:
+                continue
+            matches.extend(value.get(key) for key in keys)
+        elif kind == "index":
+            if value and len(value) > argument:
+                matches.append(value[argument])
+        elif not value:
+            continue
+        elif isinstance(value, (dict, int, str)):
+            matches.append(value)
+        else:
+            matches.extend(value[index] for index in range(len(value)))
+    return matches
+
+
+@lru_cache(maxsize=128)
+def _make_jsonpath_trie(expressions: "Tuple[str, ...]") -> "Dict[Any, Any]":
+    """
+    Merges the steps of multiple JSONPath expressions into a trie, so that
+    common prefixes of the expressions are only walked once.
+
+    Args:
+        expressions (Tuple[str, ...]): The JSONPath expressions, as adjusted
+            by `_check_jsonpath`. Expressions which are not part of the
+            simple subset are left out.
+
+    Returns:
+        Dict[Any, Any]: The trie with the steps as keys of its nodes. The
+            expressions ending at a node are listed under the key None.
+    """
+    trie = {}
+    for expression in expressions:
+        steps = _compile_simple_jsonpath(expression)
+        if steps is None:
+            continue
+        # the root is the data the traversal starts from
+        if steps and steps[0][0] == "root":
+            steps = steps[1:]
+        node = trie
+        for step in steps:
+            node = node.setdefault(step, {})
+        node.setdefault(None, []).append(expression)
+    return trie
+
+
+def _find_simple_jsonpaths(
+    trie: "Dict[Any, Any]", data: "Any"
+) -> "Dict[str, List[Any]]":
+    """
+    Finds the values matching multiple simple JSONPath expressions in a
+    single depth-first traversal of the data.
+
+    Args:
+        trie (Dict[Any, Any]): The trie of the expressions made by
+            `_make_jsonpath_trie`.
+        data (Any): The data to be searched.
+
+    Returns:
+        Dict[str, List[Any]]: The matching values per expression, except
+            for expressions whose evaluation fails.
+    """
+    results = {}
+    stack = [(trie, [data])]
+    while stack:
+        node, values = stack.pop()
+        for step, child in node.items():
+            if step is None:
+                for expression in child:
+                    results[expression] = values
+                continue
+            try:
+                matches = _apply_simple_step(step, values, data)
+            except (AttributeError, IndexError, KeyError, TypeError):
+                # the expressions below are left out, so that the error
+                # is raised when one of them is evaluated on its own
+                continue
+            stack.append((child, matches))
+    return results
+
+
+class _JsonStreamReader:
+    """
+    Incremental reader of a json document from a text stream, which only
+    decodes the values needed by the JSONPath expressions of a trie.
+
+    The values which are not reached by any expression are scanned
+    without being decoded and replaced by None, so that objects and arrays
+    keep their keys and lengths. Arrays of numbers matched by one of the
+    array expressions are decoded chunk by chunk into numpy arrays.
+    """
+
+    def __init__(
+        self,
+        stream: "IO[str]",
+        arrays: "AbstractSet[str]",
+        chunk_size: int = _JSON_CHUNK_SIZE,
+    ) -> None:
+        self.stream = stream
+        self.arrays = arrays
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.mark = None
+
+    def _fill(self) -> bool:
+        """Read the next chunk of the stream into the buffer. The text
+        before the position, or before the mark, if set, is dropped."""
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            return False
+        start = self.pos if self.mark is None else self.mark
+        self.buffer = self.buffer[start:] + chunk
+        self.pos -= start
+        if self.mark is not None:
+            self.mark -= start
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character, or an empty
+        string at the end of the stream"""
+        while True:
+            self.pos = _JSON_WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos : self.pos + 1]
+
+    def _expect(self, characters: str) -> str:
+        """Consume the next character, which must be one of the given"""
+        character = self._peek()
+        if not character or character not in characters:
+            raise self._error(f"Expecting one of {characters!r}")
+        self.pos += 1
+        return character
+
+    def _match(self, pattern: "re.Pattern") -> "Optional[re.Match]":
+        """Match a token at the position. More of the stream is read as
+        long as the token could continue after the end of the buffer."""
+        while True:
+            match = pattern.match(self.buffer, self.pos)
+            if match and match.end() < len(self.buffer) or not self._fill():
+                return match
+
+    def _string(self) -> str:
+        """Decode a string, starting after its opening quote"""
+        if self._match(_JSON_STRING_END) is None:
+            raise self._error("Unterminated string")
+        value, self.pos = json.decoder.scanstring(self.buffer, self.pos)
+        return value
+
+    def _skip(self) -> None:
+        """Scan over the next value without decoding it"""
+        character = self._peek()
+        if character not in ("[", "{", '"'):
+            match = self._match(_JSON_SCALAR)
+            if match is None:
+                raise self._error("Expecting value")
+            self.pos = match.end()
+            return None
+        depth = 0
+        while True:
+            match = _JSON_STRUCTURE.search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)
+                if not self._fill():
+                    raise self._error("Unterminated value")
+                continue
+            self.pos = match.end()
+            if match.group() == '"':
+                match = self._match(_JSON_STRING_END)
+                if match is None:
+                    raise self._error("Unterminated string")
+                self.pos = match.end()
+            elif match.group() in "[{":
+                depth += 1
+            else:
+                depth -= 1
+            if depth == 0:
+                return None
+
+    def _value(self) -> "Any":
+        """Decode the next value as a whole"""
+        self._peek()
+        self.mark = self.pos
+        try:
+            self._skip()
+            return json.loads(self.buffer[self.mark : self.pos])
+        finally:
+            self.mark = None
+
+    def _numbers(self) -> "Union[np.ndarray, List[Any]]":
+        """Decode an array chunk by chunk. Arrays of integers and floats
+        are returned as numpy array, all others as list."""
+        self.pos += 1
+        if self._peek() == "]":
+            self.pos += 1
+            return []
+        chunks = []
+        numeric = True
+        while True:
+            match = _JSON_NUMBERS.match(self.buffer, self.pos)
+            if match is not None:
+                chunk, is_numeric = _decode_numbers(match.group()[:-1])
+                chunks.append(chunk)
+                numeric = numeric and is_numeric
+                self.pos = match.end()
+                if self.pos == len(self.buffer):
+                    self._fill()
+                continue
+            # values which are not part of a run of numbers, e.g. the
+            # last one or strings, are decoded one by one
+            value = self._value()
+            if not chunks or not isinstance(chunks[-1], list):
+                chunks.append([])
+            chunks[-1].append(value)
+            numeric = numeric and (
+                type(value) is float
+                or type(value) is int
+                and -(2**63) <= value < 2**63
+            )
+            if self._expect(",]") == "]":
+                break
+        if numeric:
+            return np.concatenate([np.asarray(chunk) for chunk in chunks])
+        return [
+            value
+            for chunk in chunks
+            for value in (
+                chunk.tolist() if isinstance(chunk, np.ndarray) else chunk
+            )
+        ]
+
+    def _object(self, nodes: "List[Dict[Any, Any]]") -> "Dict[str, Any]":
+        """Read an object, decoding the values of the keys needed by the
+        nodes of the trie"""
+        self.pos += 1
+        value = {}
+        if self._peek() == "}":
+            self.pos += 1
+            return value
+        while True:
+            self._expect('"')
+            key = self._string()
+            self._expect(":")
+            children = [
+                node[step]
+                for node in nodes
+                for step in (("field", key), ("fields", None))
+                if step in node
+            ]
+            value[key] = self.read(children) if children else self._skip()
+            if self._expect(",}") == "}":
+                return value
+
+    def _array(self, nodes: "List[Dict[Any, Any]]") -> "List[Any]":
+        """Read an array, decoding the items needed by the nodes of the
+        trie"""
+        self.pos += 1
+        value = []
+        if self._peek() == "]":
+            self.pos += 1
+            return value
+        slices = []
+        indices = {}
+        for node in nodes:
+            for step, child in node.items():
+                if step == ("slice", None):
+                    slices.append(child)
+                elif step is not None and step[0] == "index":
+                    indices.setdefault(step[1], []).append(child)
+        while True:
+            children = slices + indices.get(len(value), [])
+            value.append(self.read(children) if children else self._skip())
+            if self._expect(",]") == "]":
+                return value
+
+    def read(self, nodes: "List[Dict[Any, Any]]") -> "Any":
+        """Read the next value, decoding the parts of it needed by the
+        nodes of the trie which apply to it"""
+        character = self._peek()
+        if character == "{":
+            # a wildcard in brackets matches a single object itself
+            nodes = list(nodes)
+            for node in nodes:
+                if ("slice", None) in node:
+                    nodes.append(node[("slice", None)])
+        if any(None in node for node in nodes):
+            if character == "[" and all(
+                node.keys() == {None}
+                and all(expression in self.arrays for expression in node[None])
+                for node in nodes
+            ):
+                return self._numbers()
+            return self._value()
+        if character == "{":
+            return self._object(nodes)
+        if character == "[":
+            return self._array(nodes)
+        return self._value()
+
+
+def _decode_numbers(text: str) -> "Tuple[Union[np.ndarray, List[Any]], bool]":
+    """Decode a comma separated run of json numbers. Runs of only integers
+    or only floats are returned as numpy array, others as list. The flag
+    tells whether the numbers fit into an integer or float array."""
+    values = json.loads(f"[{text}]")
+    if any(character in text for character in ".eE"):
+        if _JSON_INTEGER.search(text):
+            # mixed integers and floats are kept as decoded
+            return values, True
+    array = np.array(values)
+    if array.dtype.kind not in "if":
+        return values, False
+    return array, True
+
+
+def _load_json_paths(
+    stream: "IO[str]",
+    expressions: "Tuple[str, ...]",
+    arrays: "AbstractSet[str]" = frozenset(),
+    chunk_size: int = _JSON_CHUNK_SIZE,
+) -> "Any":
+    """
+    Loads a json document incrementally from a text stream, decoding only
+    the values needed by the given simple JSONPath expressions.
+
+    All values, which are not reached by the expressions, are replaced by
+    None and are scanned, but not validated. Hence the expressions find
+    the same values in the returned document as in the whole document,
+    while the memory for decoding the rest of it is never allocated.
+
+    Args:
+        stream (IO[str]): The text stream of the json document.
+        expressions (Tuple[str, ...]): The JSONPath expressions, as
+            adjusted by `_check_jsonpath`. All of them must be part of the
+            simple subset.
+        arrays (AbstractSet[str]): Expressions of the subset whose arrays
+            of numbers are decoded into numpy arrays. Only applies to the
+            values which are not reached by any other expression.
+        chunk_size (int): Number of characters read from the stream at
+            once.
+
+    Returns:
+        Any: The document with the values needed by the expressions.
+    """
+    reader = _JsonStreamReader(stream, arrays, chunk_size)
+    document = reader.read([_make_jsonpath_trie(expressions)])
+    if reader._peek():
+        raise reader._error("Extra data")
+    return document
@@ -2,20 +2,25 @@
 
 import json
 import warnings
+from io import IOBase
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 from rdflib import Graph
 
 from data2rdf.config import Config
+from data2rdf.diagnostics import Diagnostics
 from data2rdf.modes import PipelineMode
 from data2rdf.parsers import Parser
+from data2rdf.stats import PipelineStats, StageStats, count, stage
 from data2rdf.utils import make_prefix
 
 from pydantic import (  # isort:skip
     BaseModel,
     ConfigDict,
     Field,
+    InstanceOf,
+    PrivateAttr,
     field_validator,
     model_validator,
 )
@@ -32,9 +37,10 @@ class Data2RDF(BaseModel):
 
     Parameters:
     - raw_data (Union[str, bytes, Dict[str, Any]]):
-        In case of a csv: `str` with the file path or the content of the file itself.
-        In case of a json file: `dict` for the content of the file of `str` for the file content or file path.
+        In case of a csv: `str` with the file path or the content of the file itself, `bytes` or a file object.
+        In case of a json file: `dict` for the content of the file of `str` for the file content or file path, `bytes` or a file object.
         In case of an excel file: `btyes` for the content or `str` for the file path
+        Files, `bytes` and file objects of csv and json files may be compressed with gzip, bz2, xz or zstd.
     - mapping (Union[str, Dict[str, Any]]): File path to the mapping file to be parsed or a dictionary with the mapping.
     - parser (Parser): Parser to be used depending on the type of raw data file.
     - parser_args (Dict[str, Any]): A dictionary with specific arguments for the parser. These are passed to the parser
@@ -42,6 +48,8 @@ class Data2RDF(BaseModel):
     - config (Union[Dict[str, Any], Config]): Configuration object. Defaults to a new instance of Config.
     - additional_triples (Optional[Union[str, Graph]]): File path or rdflib-object for a Graph with extra triples for the
     resulting pipeline graph.
+    - stats_hook (Optional[Callable[[StageStats], Any]]): Callable which is called with the timings and counters of
+    every finished stage of the pipeline run, e.g. for forwarding them to a tracer.
     """
 
     mode: PipelineMode = Field(
@@ -50,12 +58,17 @@ class Data2RDF(BaseModel):
         the ABox (for data instances) or the TBox (for the class hierarchy/taxonomy)""",
     )
 
-    raw_data: Union[str, bytes, Dict[str, Any], List[Dict[str, Any]]] = Field(
+    # file objects come first, so that they are not consumed by
+    # trying to validate them as list
+    raw_data: Union[
+        InstanceOf[IOBase], str, bytes, Dict[str, Any], List[Dict[str, Any]]
+    ] = Field(
         ...,
         description="""
-        In case of a csv: `str` with the file path or the content of the file itself.
-        In case of a json file: `dict` or `list` for the content of the file of `str` for the file content or file path.
-        In case of an excel file: `btyes` for the content or `str` for the file path""",
+        In case of a csv: `str` with the file path or the content of the file itself, `bytes` or a file object.
+        In case of a json file: `dict` or `list` for the content of the file of `str` for the file content or file path, `bytes` or a file object.
+        In case of an excel file: `btyes` for the content or `str` for the file path
+        Files, `bytes` and file objects of csv and json files may be compressed with gzip, bz2, xz or zstd.""",
     )
     mapping: Union[str, List[Any]] = Field(
         ...,
@@ -82,10 +95,18 @@ class Data2RDF(BaseModel):
         description="Filepath or rdflib-object for a Graph with extra triples for the resulting pipeline graph.",
     )
 
+    stats_hook: Optional[Callable[[StageStats], Any]] = Field(
+        None,
+        description="""Callable which is called with the timings and counters
+        of every finished stage of the pipeline run.""",
+    )
+
     model_config = ConfigDict(
         arbitrary_types_allowed=True, use_enum_values=True
     )
 
+    _stats: PipelineStats = PrivateAttr(default_factory=PipelineStats)
+
     @field_validator("config")
     @classmethod
     def validate_config(cls, value: Union[Dict[str, Any], Config]) -> Config:
@@ -126,16 +147,48 @@ class Data2RDF(BaseModel):
     @classmethod
     def run_pipeline(cls, self: "Data2RDF") -> "Data2RDF":
         """Run pipeline."""
-        self.parser = self.parser(
-            raw_data=self.raw_data,
-            mapping=self.mapping,
-            config=self.config,
-            mode=self.mode,
-            parser_args=self.parser_args,
-        )
+        self._stats.hook = self.stats_hook
+        with self._stats.activate():
+            self.parser = self.parser(
+                raw_data=self.raw_data,
+                mapping=self.mapping,
+                config=self.config,
+                mode=self.mode,
+                parser_args=self.parser_args,
+            )
 
         return self
 
+    @property
+    def stats(self) -> PipelineStats:
+        """
+        Returns the timings and counters of the stages of the pipeline run.
+
+        The stages are `load_data_file`, `load_mapping_file` and `run_parser`
+        of the parser as well as `load_qudt_graph` whenever the QUDT ontology
+        is not cached yet. The `json_ld` and `graph` stages are recorded
+        when the according property of the pipeline is accessed. Only the
+        last access of each of them is kept.
+
+        Returns:
+            PipelineStats: The statistics of the pipeline run.
+        """
+        return self._stats
+
+    @property
+    def diagnostics(self) -> Diagnostics:
+        """
+        Returns the collector of the mismatches and other diagnostics found
+        by the parser, e.g. keys of the data file without a match in the
+        mapping. Use `summary()` for the counts grouped by category, key and
+        location. The emission of the entries as warnings is set through the
+        `diagnostics` field of the config.
+
+        Returns:
+            Diagnostics: The diagnostics of the parser.
+        """
+        return self.parser.diagnostics
+
     @property
     def json_ld(self) -> Dict[str, Any]:
         """
@@ -154,7 +207,11 @@ class Data2RDF(BaseModel):
         Returns:
             Dict[str, Any]: A dictionary of JSON-LD for the graph.
         """
+        with self._stats.activate(), stage("json_ld", replace=True):
+            return self._make_json_ld()
 
+    def _make_json_ld(self) -> Dict[str, Any]:
+        """Make the JSON-LD of the graph based on the pipeline mode."""
         if self.mode == PipelineMode.ABOX:
             if not self.config.suppress_file_description:
                 model = {
@@ -205,10 +262,14 @@ class Data2RDF(BaseModel):
             Graph: A graph object containing the pipeline's data.
         """
 
-        graph = Graph(identifier=self.config.graph_identifier)
-        graph.parse(data=json.dumps(self.json_ld), format="json-ld")
-        if self.additional_triples:
-            graph += self._validate_additional_triples(self.additional_triples)
+        with self._stats.activate(), stage("graph", replace=True):
+            graph = Graph(identifier=self.config.graph_identifier)
+            graph.parse(data=json.dumps(self.json_ld), format="json-ld")
+            if self.additional_triples:
+                graph += self._validate_additional_triples(
+                    self.additional_triples
+                )
+            count("triples", len(graph))
         return graph
 
     def to_dict(self, schema: Callable = None) -> "List[Dict[str, Any]]":
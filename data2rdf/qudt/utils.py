@@ -1,14 +1,19 @@
 """Data2RDF utils"""
+import os
 import tempfile
 import warnings
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import requests
 from rdflib import Graph
 
+from data2rdf.diagnostics import report
+from data2rdf.stats import count, stage
 from data2rdf.warnings import QUDTMappingWarning
 
+if TYPE_CHECKING:
+    import requests
+
 
 def _qudt_sparql(symbol: str) -> str:
     return f"""PREFIX qudt: <http://qudt.org/schema/qudt/>
@@ -26,7 +31,10 @@ def _qudt_sparql(symbol: str) -> str:
 
 
 @lru_cache
-def _get_qudt_ontology(qudt_iri: str) -> requests.Response:
+def _get_qudt_ontology(qudt_iri: str) -> "requests.Response":
+    # imported here, since it is only needed for downloading the ontology
+    import requests
+
     response = requests.get(qudt_iri)
     if response.status_code != 200:
         raise RuntimeError(
@@ -46,15 +54,20 @@ def _to_tempfile(content) -> str:
 
 @lru_cache
 def _get_qudt_graph(qudt_iri: str) -> Graph:
-    response = _get_qudt_ontology(qudt_iri)
-    file = _to_tempfile(response.text)
+    with stage("load_qudt_graph"):
+        if os.path.isfile(qudt_iri):
+            file = qudt_iri
+        else:
+            response = _get_qudt_ontology(qudt_iri)
+            file = _to_tempfile(response.text)
 
-    graph = Graph()
-    graph.parse(file, encoding="utf-8")
+        graph = Graph()
+        graph.parse(file, encoding="utf-8")
     return graph
 
 
 def _get_query_match(symbol: str, qudt_iri: str) -> List[str]:
+    count("qudt_lookups")
     graph = _get_qudt_graph(qudt_iri)
     query = _qudt_sparql(symbol)
     return [str(row["unit"]) for row in graph.query(query)]
@@ -86,9 +99,18 @@ def _check_qudt_mapping(symbol: Optional[str]) -> Optional[str]:
     return unit
 
 
+def _no_label_message(iri: str, location: Any) -> str:
+    return f"No QUDT label and symbol found for unit with iri `{iri}`."
+
+
+def _multiple_labels_message(iri: str, location: Any) -> str:
+    return f"Multiple QUDT symbols and labels found for unit with iri `{iri}`."
+
+
 def _get_qudt_label_and_symbol(
     iri: str, qudt_iri: str, language: str
 ) -> Dict[str, Any]:
+    count("qudt_lookups")
     graph = _get_qudt_graph(qudt_iri)
     gen_query = f"""PREFIX qudt: <http://qudt.org/schema/qudt/>
     PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
@@ -110,15 +132,17 @@ def _get_qudt_label_and_symbol(
         for row in graph.query(gen_query)
     ]
     if len(match) == 0:
-        warnings.warn(
-            f"No QUDT label and symbol found for unit with iri `{iri}`.",
+        report(
             QUDTMappingWarning,
+            iri,
+            message=_no_label_message,
         )
         unit = {}
     elif len(match) > 1:
-        warnings.warn(
-            f"Multiple QUDT symbols and labels found for unit with iri `{iri}`.",
+        report(
             QUDTMappingWarning,
+            iri,
+            message=_multiple_labels_message,
         )
         unit = match[0]
     else:
@@ -0,0 +1,142 @@
+"""Data2RDF run statistics"""
+
+import time
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+_ACTIVE_STATS: "ContextVar[Optional[PipelineStats]]" = ContextVar(
+    "data2rdf_active_stats", default=None
+)
+
+
+class StageStats(BaseModel):
+    """Timing and counters of a single stage of a pipeline run"""
+
+    name: str = Field(
+        ..., description="Name of the stage, e.g. `load_data_file`."
+    )
+    wall_time: float = Field(
+        0.0, description="Elapsed wall clock time of the stage in seconds."
+    )
+    cpu_time: float = Field(
+        0.0, description="CPU time consumed by the process during the stage."
+    )
+    counters: Dict[str, int] = Field(
+        default_factory=dict,
+        description="""Counters collected during the stage, e.g. `rows`,
+        `columns`, `models`, `qudt_lookups` or `warnings`.""",
+    )
+
+
+class PipelineStats(BaseModel):
+    """Collection of the stages recorded during a pipeline run.
+
+    Stages are recorded in the order in which they are finished, so nested
+    stages (e.g. `json_ld` within `graph`) appear before their parent.
+    Their times are included in the times of the parent stage, their
+    counters are not. Stages which are recorded on every access of a
+    property, e.g. `json_ld` and `graph`, replace their former record,
+    so that only their last run is kept."""
+
+    stages: List[StageStats] = Field(
+        default_factory=list, description="Finished stages of the run."
+    )
+    hook: Optional[Callable[[StageStats], Any]] = Field(
+        None,
+        description="""Callable which is called with every finished stage,
+        e.g. for forwarding the stage as span to an external tracer.
+        Exceptions raised by the hook are emitted as warnings.""",
+        exclude=True,
+    )
+
+    _stack: List[StageStats] = PrivateAttr(default_factory=list)
+
+    def __getitem__(self, name: str) -> StageStats:
+        """Return the last finished stage with the given name"""
+        for stage_stats in reversed(self.stages):
+            if stage_stats.name == name:
+                return stage_stats
+        raise KeyError(f"No stage with name `{name}` has been recorded.")
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Return the stages aggregated by their name"""
+        summary = {}
+        for stage_stats in self.stages:
+            entry = summary.setdefault(
+                stage_stats.name,
+                {"calls": 0, "wall_time": 0.0, "cpu_time": 0.0},
+            )
+            entry["calls"] += 1
+            entry["wall_time"] += stage_stats.wall_time
+            entry["cpu_time"] += stage_stats.cpu_time
+            for key, value in stage_stats.counters.items():
+                entry[key] = entry.get(key, 0) + value
+        return summary
+
+    @contextmanager
+    def activate(self) -> Iterator["PipelineStats"]:
+        """Make this collection the target of `stage` and `count`"""
+        token = _ACTIVE_STATS.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_STATS.reset(token)
+
+    @contextmanager
+    def stage(self, name: str, replace: bool = False) -> Iterator[StageStats]:
+        """Record wall time and CPU time of a stage.
+        If `replace` is set, former records of the stage are removed."""
+        stage_stats = StageStats(name=name)
+        self._stack.append(stage_stats)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield stage_stats
+        finally:
+            stage_stats.wall_time = time.perf_counter() - wall_start
+            stage_stats.cpu_time = time.process_time() - cpu_start
+            self._stack.pop()
+            if replace:
+                self.stages = [
+                    other for other in self.stages if other.name != name
+                ]
+            self.stages.append(stage_stats)
+            if self.hook:
+                # an exception of the hook must not replace an exception
+                # raised during the stage
+                try:
+                    self.hook(stage_stats)
+                except Exception as error:
+                    warnings.warn(
+                        f"Stats hook failed for stage `{name}`: {error!r}",
+                        RuntimeWarning,
+                        stacklevel=3,
+                    )
+
+    def count(self, key: str, value: int = 1) -> None:
+        """Increase a counter of the innermost running stage"""
+        if self._stack:
+            counters = self._stack[-1].counters
+            counters[key] = counters.get(key, 0) + value
+
+
+@contextmanager
+def stage(name: str, replace: bool = False) -> Iterator[Optional[StageStats]]:
+    """Record a stage in the active `PipelineStats`, if there is any"""
+    stats = _ACTIVE_STATS.get()
+    if stats is None:
+        yield None
+    else:
+        with stats.stage(name, replace) as stage_stats:
+            yield stage_stats
+
+
+def count(key: str, value: int = 1) -> None:
+    """Increase a counter of the running stage in the active `PipelineStats`"""
+    stats = _ACTIVE_STATS.get()
+    if stats is not None:
+        stats.count(key, value)
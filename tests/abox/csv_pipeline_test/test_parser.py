@@ -324,6 +324,213 @@ def test_csv_parser_config(config) -> None:
     assert sorted(list(parser.dataframe.columns)) == sorted(columns)
 
 
+def test_csv_parser_dataframe_dtypes() -> None:
+    import numpy as np
+
+    from data2rdf.parsers import CSVParser
+
+    parser = CSVParser(
+        raw_data=raw_data,
+        mapping=os.path.join(mapping_folder, "tensile_test_mapping.json"),
+        parser_args=parser_args,
+    )
+
+    units = {model.key: model.unit for model in parser.dataframe_metadata}
+    assert units["Standardkraft"] == "http://qudt.org/vocab/unit/N"
+
+    for name, column in parser.dataframe.items():
+        assert column.dtype == np.float64
+        assert len(column) == 5734
+
+
+def test_csv_parser_chunksize() -> None:
+    import pandas as pd
+    from rdflib import Graph
+
+    from data2rdf.parsers import CSVParser
+
+    chunks = []
+    parser = CSVParser(
+        raw_data=raw_data,
+        mapping=os.path.join(mapping_folder, "tensile_test_mapping.json"),
+        parser_args={
+            **parser_args,
+            "chunksize": 1000,
+            "dataframe_callback": chunks.append,
+        },
+    )
+    expected_graph = Graph()
+    expected_graph.parse(expected)
+
+    assert parser.dataframe is None
+    assert len(parser.dataframe_metadata) == 6
+    assert parser.graph.isomorphic(expected_graph)
+
+    assert [len(chunk) for chunk in chunks] == [1000] * 5 + [734]
+    dataframe = pd.concat(chunks)
+    assert sorted(dataframe.columns) == sorted(columns)
+
+    parser = CSVParser(
+        raw_data=raw_data,
+        mapping=os.path.join(mapping_folder, "tensile_test_mapping.json"),
+        parser_args=parser_args,
+    )
+    pd.testing.assert_frame_equal(dataframe, parser.dataframe)
+
+
+def test_csv_parser_inspect() -> None:
+    from data2rdf.parsers import CSVParser
+
+    header = CSVParser.inspect(raw_data, parser_args=parser_args)
+
+    assert len(header.metadata) == 20
+    assert header.metadata["Prüfer"] is None
+    assert header.metadata["Prüfgeschwindigkeit"] == "mm/s"
+    assert header.columns == {
+        "Prüfzeit": "s",
+        "Standardkraft": "N",
+        "Traversenweg absolut": "mm",
+        "Standardweg": "mm",
+        "Breitenänderung": "mm",
+        "Dehnung": "mm",
+    }
+
+    without_units = CSVParser.inspect(
+        raw_data, parser_args={**parser_args, "dataframe_header_length": 1}
+    )
+    assert list(without_units.columns) == list(header.columns)
+    assert set(without_units.columns.values()) == {None}
+
+
+@pytest.mark.parametrize("as_bytes", [False, True])
+def test_csv_parser_multiline_metadata(as_bytes) -> None:
+    from data2rdf.parsers import CSVParser
+
+    data = (
+        'Name\t"line one\nline two"\n'
+        'Width\t5\t"mm"\n'
+        "Time\tForce\n"
+        "s\tN\n"
+        "1\t2\n"
+        "3\t4\n"
+    )
+    mapping = [
+        {"key": "Name", "iri": "https://www.example.org/Name"},
+        {"key": "Width", "iri": "https://www.example.org/Width"},
+        {"key": "Time", "iri": "https://www.example.org/Time"},
+        {"key": "Force", "iri": "https://www.example.org/Force"},
+    ]
+    args = {"metadata_sep": "\t", "dataframe_sep": "\t", "metadata_length": 2}
+    raw = data.encode() if as_bytes else data
+
+    parser = CSVParser(raw_data=raw, mapping=mapping, parser_args=args)
+
+    values = {model.key: model.value for model in parser.general_metadata}
+    assert values == {"Name": "line oneline two", "Width": 5}
+    assert parser.dataframe.to_dict(orient="list") == {
+        "Time": [1, 3],
+        "Force": [2, 4],
+    }
+
+    header = CSVParser.inspect(raw, parser_args=args)
+    assert list(header.metadata) == ["Name", "Width"]
+    assert header.columns == {"Time": "s", "Force": "N"}
+
+
+@pytest.mark.parametrize("engine", ["c", "python", "pyarrow"])
+@pytest.mark.parametrize("dropna,rows", [(True, [3]), (False, [1, 3])])
+def test_csv_parser_dropna_unmapped_columns(dropna, rows, engine) -> None:
+    from data2rdf.parsers import CSVParser
+
+    mapping = [
+        {"key": "A", "iri": "https://www.example.org/A"},
+        {"key": "B", "iri": "https://www.example.org/B"},
+    ]
+    parser = CSVParser(
+        raw_data="A\tB\tC\n1\t2\t\n3\t4\t5\n",
+        mapping=mapping,
+        parser_args={
+            "dataframe_sep": "\t",
+            "metadata_length": 0,
+            "dataframe_header_length": 1,
+            "dropna": dropna,
+            "engine": engine,
+        },
+        config={"diagnostics": "collect"},
+    )
+
+    assert list(parser.dataframe.columns) == ["A", "B"]
+    assert parser.dataframe["A"].tolist() == rows
+
+
+@pytest.mark.parametrize("engine", ["c", "python", "pyarrow"])
+def test_csv_parser_engine(engine) -> None:
+    from importlib.util import find_spec
+
+    import pandas as pd
+    from rdflib import Graph
+
+    from data2rdf.parsers import CSVParser
+
+    parser = CSVParser(
+        raw_data=raw_data,
+        mapping=os.path.join(mapping_folder, "tensile_test_mapping.json"),
+        parser_args={**parser_args, "engine": engine},
+        config={"diagnostics": "collect"},
+    )
+    expected_graph = Graph()
+    expected_graph.parse(expected)
+
+    assert parser.graph.isomorphic(expected_graph)
+
+    summary = parser.diagnostics.summary()
+    if engine == "pyarrow" and find_spec("pyarrow") is None:
+        assert summary == {"ParserWarning": {"engine": {None: 1}}}
+    else:
+        assert summary == {}
+
+    default = CSVParser(
+        raw_data=raw_data,
+        mapping=os.path.join(mapping_folder, "tensile_test_mapping.json"),
+        parser_args=parser_args,
+    )
+    pd.testing.assert_frame_equal(parser.dataframe, default.dataframe)
+
+
+@pytest.mark.parametrize("engine", ["c", "python", "pyarrow"])
+@pytest.mark.parametrize("sep", [r"\s+", ";;"])
+def test_csv_parser_engine_separator(engine, sep) -> None:
+    from data2rdf.parsers import CSVParser
+
+    data = "A  B\n1 \t 2\n3   4\n" if sep == r"\s+" else "A;;B\n1;;2\n3;;4\n"
+    mapping = [
+        {"key": "A", "iri": "https://www.example.org/A"},
+        {"key": "B", "iri": "https://www.example.org/B"},
+    ]
+    parser = CSVParser(
+        raw_data=data,
+        mapping=mapping,
+        parser_args={
+            "dataframe_sep": sep,
+            "metadata_length": 0,
+            "dataframe_header_length": 1,
+            "engine": engine,
+        },
+        config={"diagnostics": "collect"},
+    )
+
+    assert parser.dataframe.to_dict(orient="list") == {
+        "A": [1, 3],
+        "B": [2, 4],
+    }
+
+    summary = parser.diagnostics.summary()
+    if engine == "pyarrow" or (engine == "c" and sep == ";;"):
+        assert summary == {"ParserWarning": {"engine": {None: 1}}}
+    else:
+        assert summary == {}
+
+
 @pytest.mark.parametrize("extension", ["xlsx", "json", "csv", dict])
 def test_parser_csv(extension) -> None:
     from rdflib import Graph
@@ -282,6 +282,78 @@ def test_csv_pipeline_no_match_in_mapping() -> None:
     assert sorted(list(pipeline.dataframe.columns)) == sorted(columns)
 
 
+def test_csv_pipeline_diagnostics() -> None:
+    import warnings
+
+    from data2rdf import Data2RDF, Parser
+    from data2rdf.warnings import MappingMissmatchWarning
+
+    kwargs = {
+        "raw_data": os.path.join(
+            working_folder, "data", "BAD_DX56_D_FZ2_WR00_43.TXT"
+        ),
+        "parser": Parser.csv,
+        "additional_triples": template,
+        "mapping": os.path.join(mapping_folder, "tensile_test_mapping.json"),
+        "parser_args": {
+            "metadata_sep": "\t",
+            "dataframe_sep": "\t",
+            "metadata_length": 21,
+        },
+    }
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", MappingMissmatchWarning)
+        pipeline = Data2RDF(**kwargs, config={"diagnostics": "collect"})
+
+    summary = pipeline.diagnostics.summary()
+    assert list(summary) == ["MappingMissmatchWarning"]
+    assert summary["MappingMissmatchWarning"] == {"foo bar": {"metadata": 1}}
+    assert pipeline.diagnostics.total == 1
+    assert pipeline.stats["run_parser"].counters["warnings"] == 1
+    assert pipeline.diagnostics.messages() == {
+        "MappingMissmatchWarning": {
+            "foo bar": "No match found in mapping for key `foo bar`"
+        }
+    }
+    assert sorted(list(pipeline.dataframe.columns)) == sorted(columns)
+
+    with pytest.raises(MappingMissmatchWarning, match="No match found"):
+        Data2RDF(**kwargs, config={"diagnostics": "raise"})
+
+
+def test_csv_pipeline_unmapped_columns() -> None:
+    from data2rdf import Data2RDF, Parser
+
+    path = os.path.join(mapping_folder, "tensile_test_mapping.json")
+    with open(path, encoding="utf-8") as file:
+        mapping = [
+            datum
+            for datum in json.load(file)
+            if datum["key"] not in ["Standardkraft", "Traversenweg absolut"]
+        ]
+
+    pipeline = Data2RDF(
+        raw_data=raw_data,
+        mapping=mapping,
+        parser=Parser.csv,
+        parser_args=parser_args,
+        config={"diagnostics": "collect"},
+    )
+
+    assert pipeline.diagnostics.summary() == {
+        "MappingMissmatchWarning": {
+            ("Standardkraft", "Traversenweg absolut"): {"dataframe": 1}
+        }
+    }
+    assert len(pipeline.dataframe_metadata) == 4
+    assert sorted(pipeline.dataframe.columns) == sorted(
+        set(columns) - {"StandardForce", "AbsoluteCrossheadTravel"}
+    )
+    for name, column in pipeline.dataframe.items():
+        assert len(column) == 5734
+
+
 @pytest.mark.parametrize("config", [normal_config, bad_config])
 def test_csv_pipeline_config(config) -> None:
     from rdflib import Graph
@@ -360,8 +432,23 @@ def test_csv_pipeline(extension) -> None:
     assert sort_entries(pipeline.to_dict()) == as_non_dsms_schema(metadata)
 
 
-@pytest.mark.parametrize("input_kind", ["path", "content"])
-def test_csv_pipeline_inputs(input_kind) -> None:
+@pytest.mark.parametrize(
+    "input_kind",
+    [
+        "path",
+        "content",
+        "bytes",
+        "stream",
+        "unseekable",
+        "memory_map",
+        "gzip",
+        "bz2",
+        "xz",
+        "zstd",
+        "gzip_stream",
+    ],
+)
+def test_csv_pipeline_inputs(input_kind, tmp_path) -> None:
     from rdflib import Graph
 
     from data2rdf import (  # isort:skip
@@ -371,19 +458,68 @@ def test_csv_pipeline_inputs(input_kind) -> None:
         QuantityGraph,
     )
 
+    args = parser_args
     if input_kind == "path":
         input_obj = raw_data
     elif input_kind == "content":
         with open(raw_data, encoding="utf-8") as file:
             input_obj = file.read()
+    elif input_kind == "bytes":
+        with open(raw_data, mode="rb") as file:
+            input_obj = file.read()
+    elif input_kind == "stream":
+        input_obj = open(raw_data, mode="rb")
+    elif input_kind == "unseekable":
+        from io import BytesIO, UnsupportedOperation
+
+        class UnseekableStream(BytesIO):
+            def seekable(self):
+                return False
+
+            def seek(self, *args):
+                raise UnsupportedOperation("seek")
+
+        with open(raw_data, mode="rb") as file:
+            input_obj = UnseekableStream(file.read())
+    elif input_kind == "memory_map":
+        input_obj = raw_data
+        args = {**parser_args, "memory_map": True}
+    elif input_kind in ("gzip", "bz2", "xz"):
+        import importlib
+
+        compression = importlib.import_module(
+            "lzma" if input_kind == "xz" else input_kind
+        )
+        # the compression is detected from the content, not the extension
+        input_obj = str(tmp_path / "data.TXT")
+        with open(raw_data, mode="rb") as file:
+            with compression.open(input_obj, mode="wb") as compressed:
+                compressed.write(file.read())
+    elif input_kind == "zstd":
+        zstandard = pytest.importorskip("zstandard")
+
+        input_obj = str(tmp_path / "data.TXT")
+        with open(raw_data, mode="rb") as file:
+            with open(input_obj, mode="wb") as compressed:
+                compressed.write(
+                    zstandard.ZstdCompressor().compress(file.read())
+                )
+    elif input_kind == "gzip_stream":
+        import gzip
+        from io import BytesIO
+
+        with open(raw_data, mode="rb") as file:
+            input_obj = BytesIO(gzip.compress(file.read()))
 
     pipeline = Data2RDF(
         raw_data=input_obj,
         mapping=os.path.join(mapping_folder, "tensile_test_mapping.json"),
         parser=Parser.csv,
-        parser_args=parser_args,
+        parser_args=args,
         additional_triples=template,
     )
+    if input_kind == "stream":
+        input_obj.close()
 
     assert len(pipeline.general_metadata) == 20
     for row in pipeline.general_metadata:
@@ -457,3 +593,71 @@ def test_csv_pipeline_alias() -> None:
         metadata
     )
     assert sort_entries(pipeline.to_dict()) == as_non_dsms_schema(metadata)
+
+
+def test_csv_pipeline_stats() -> None:
+    from data2rdf import Data2RDF, Parser
+
+    finished = []
+
+    pipeline = Data2RDF(
+        raw_data=raw_data,
+        mapping=os.path.join(mapping_folder, "tensile_test_mapping.json"),
+        parser=Parser.csv,
+        parser_args=parser_args,
+        stats_hook=finished.append,
+    )
+
+    run_parser = pipeline.stats["run_parser"]
+    assert run_parser.counters["rows"] == 5734
+    assert run_parser.counters["columns"] == 6
+    assert run_parser.counters["models"] == 26
+    assert run_parser.counters["qudt_lookups"] > 0
+    assert run_parser.wall_time > 0
+    assert pipeline.stats["load_mapping_file"].counters["mappings"] > 0
+
+    pipeline.graph
+
+    summary = pipeline.stats.summary()
+    for name in ["load_data_file", "run_parser", "json_ld", "graph"]:
+        assert summary[name]["calls"] >= 1
+    assert summary["graph"]["triples"] > 0
+    names = [stage.name for stage in pipeline.stats.stages]
+    assert [stage.name for stage in finished] == names
+
+    for _ in range(3):
+        pipeline.graph
+        pipeline.json_ld
+    summary = pipeline.stats.summary()
+    assert summary["graph"]["calls"] == 1
+    assert summary["json_ld"]["calls"] == 1
+    assert len(pipeline.stats.stages) == len(names)
+
+
+def test_csv_pipeline_stats_hook_error() -> None:
+    from data2rdf import Data2RDF, Parser
+
+    def hook(stage) -> None:
+        raise RuntimeError("hook failed")
+
+    with pytest.warns(RuntimeWarning, match="Stats hook failed"):
+        pipeline = Data2RDF(
+            raw_data=raw_data,
+            mapping=os.path.join(mapping_folder, "tensile_test_mapping.json"),
+            parser=Parser.csv,
+            parser_args=parser_args,
+            stats_hook=hook,
+        )
+    assert pipeline.stats["run_parser"].counters["rows"] == 5734
+
+    with pytest.warns(RuntimeWarning, match="Stats hook failed"):
+        with pytest.raises(ValueError, match="metadata_sep"):
+            Data2RDF(
+                raw_data=raw_data,
+                mapping=os.path.join(
+                    mapping_folder, "tensile_test_mapping.json"
+                ),
+                parser=Parser.csv,
+                parser_args={**parser_args, "metadata_sep": None},
+                stats_hook=hook,
+            )
@@ -553,3 +553,37 @@ def test_pipeline_json_custom_relations_quantity_graph() -> None:
     expected_graph.parse(data=EXPECTED_SUBGRAPHS)
 
     assert pipeline.graph.isomorphic(expected_graph)
+
+
+def test_pipeline_json_custom_relations_compiled_paths() -> None:
+    from data2rdf import Data2RDF, Parser
+    from data2rdf.parsers.json import _compile_jsonpath
+
+    from data2rdf.parsers.utils import (  # isort:skip
+        _compile_simple_jsonpath,
+        _make_jsonpath_trie,
+    )
+
+    data = {
+        "data": [
+            {"name": f"Jane{number}", "age": number, "lab_no": number}
+            for number in range(100)
+        ]
+    }
+
+    _compile_jsonpath.cache_clear()
+    _compile_simple_jsonpath.cache_clear()
+    _make_jsonpath_trie.cache_clear()
+    for _ in range(2):
+        Data2RDF(
+            raw_data=data,
+            mapping=MAPPING_WILDCARD,
+            parser=Parser.json,
+            config={"base_iri": BASE_IRI},
+        )
+
+    # the source and the object locations, of which one is also the
+    # suffix, are compiled once for all objects and files. all of them
+    # are simple paths, which are not parsed by jsonpath_ng
+    assert _compile_simple_jsonpath.cache_info().misses == 4
+    assert _compile_jsonpath.cache_info().misses == 0
@@ -143,3 +143,61 @@ def test_json_parser_different_mapping_files(extension) -> None:
     assert remove_ids(parser.to_dict(schema=dsms_schema)) == sort_entries(
         metadata
     )
+
+
+def test_parser_json_streaming(tmp_path) -> None:
+    import numpy as np
+
+    from data2rdf.parsers import JsonParser
+
+    # large parts of the document, which are not referenced by the mapping,
+    # are skipped while streaming
+    with open(raw_data_file, encoding="utf-8") as file:
+        data = json.load(file)
+    data["unmapped"] = {"values": list(range(10000)), "text": "]}[{"}
+    path = tmp_path / "sample_data.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    parsers = []
+    for streaming in [False, True]:
+        parser = JsonParser(
+            raw_data=str(path),
+            mapping=mapping_file,
+            parser_args={"streaming": streaming},
+        )
+        parsers.append(parser)
+    full, streamed = parsers
+
+    assert streamed.graph.isomorphic(full.graph)
+    assert streamed.dataframe.equals(full.dataframe)
+    assert remove_ids(streamed.to_dict(schema=dsms_schema)) == sort_entries(
+        metadata
+    )
+    for name, column in streamed.dataframe.items():
+        assert column.dtype == np.float64
+
+
+def test_parser_json_streaming_fallback() -> None:
+    from rdflib import Graph
+
+    from data2rdf.parsers import JsonParser
+    from data2rdf.warnings import ParserWarning
+
+    with open(mapping_file, encoding="utf-8") as file:
+        mapping = json.load(file)
+    for datum in mapping:
+        if datum["key"] == "Dehnung":
+            datum["value_location"] = "$..Dehnung"
+
+    with pytest.warns(ParserWarning, match="cannot be resolved while"):
+        parser = JsonParser(
+            raw_data=raw_data_file,
+            mapping=mapping,
+            parser_args={"streaming": True},
+        )
+
+    expected_graph = Graph()
+    expected_graph.parse(expected)
+
+    assert parser.graph.isomorphic(expected_graph)
+    assert sorted(series) == sorted(parser.dataframe)
@@ -108,6 +108,51 @@ def test_pipeline_json(mapping_format, data_format) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    "input_kind", ["stream", "bytes", "gzip", "bz2", "xz", "gzip_bytes"]
+)
+def test_pipeline_json_inputs(input_kind, tmp_path) -> None:
+    import bz2
+    import gzip
+    import lzma
+
+    from rdflib import Graph
+
+    from data2rdf import Data2RDF, Parser
+
+    with open(raw_data_file, mode="rb") as file:
+        content = file.read()
+
+    compressions = {"gzip": gzip, "bz2": bz2, "xz": lzma}
+    if input_kind == "stream":
+        raw_data = open(raw_data_file, encoding="utf-8")
+    elif input_kind == "bytes":
+        raw_data = content
+    elif input_kind in compressions:
+        raw_data = str(tmp_path / "sample_data.json")
+        with compressions[input_kind].open(raw_data, mode="wb") as file:
+            file.write(content)
+    elif input_kind == "gzip_bytes":
+        raw_data = gzip.compress(content)
+
+    pipeline = Data2RDF(
+        raw_data=raw_data,
+        mapping=mapping_file,
+        parser=Parser.json,
+    )
+    if input_kind == "stream":
+        raw_data.close()
+
+    assert len(pipeline.general_metadata) == 3
+    assert len(pipeline.dataframe_metadata) == 2
+    assert sorted(series) == sorted(pipeline.dataframe)
+
+    expected_graph = Graph()
+    expected_graph.parse(expected)
+
+    assert pipeline.graph.isomorphic(expected_graph)
+
+
 @pytest.mark.parametrize("extension", ["xlsx", "json", "csv", dict])
 def test_json_pipeline_different_mapping_types(extension) -> None:
     from rdflib import Graph
@@ -98,3 +98,124 @@ def test_bad_with_blank_space():
     assert model.measurement_unit.symbol == "mm"
     assert model.measurement_unit.label == "Millimetre"
     assert model.measurement_unit.namespace == "http://qudt.org/vocab/unit"
+
+
+@pytest.mark.parametrize("full_validation", [False, True])
+def test_make_graphs(full_validation):
+    from data2rdf import PropertyGraph, QuantityGraph
+    from data2rdf.models.graph import _make_graphs
+
+    config = {"full_validation": full_validation}
+    values = [0.1, "2", "3.5", 4]
+    quantities = _make_graphs(
+        QuantityGraph,
+        values,
+        key="test",
+        unit="mm",
+        iri="https://example.org/test",
+        config=config,
+    )
+    expected = [
+        QuantityGraph(
+            value=value,
+            key="test",
+            unit="mm",
+            iri="https://example.org/test",
+            config=config,
+        )
+        for value in values
+    ]
+    assert [model.value for model in quantities] == [0.1, 2, 3.5, 4]
+    assert [model.model_dump() for model in quantities] == [
+        model.model_dump() for model in expected
+    ]
+    assert len({id(model) for model in quantities}) == len(values)
+
+    values = ["foo", 1, True, {"not": "trusted"}]
+    properties = _make_graphs(
+        PropertyGraph,
+        values[:-1],
+        key="test",
+        iri="https://example.org/test",
+        config=config,
+    )
+    assert [model.value for model in properties] == values[:-1]
+    assert all(model.suffix == "test" for model in properties)
+
+    with pytest.raises(ValueError):
+        _make_graphs(
+            PropertyGraph,
+            values,
+            key="test",
+            iri="https://example.org/test",
+            config=config,
+        )
+
+
+def test_make_graphs_numpy_values():
+    import numpy as np
+
+    from data2rdf import QuantityGraph
+    from data2rdf.models.graph import _make_graphs
+
+    values = np.array([1.5, 2.5, 3.5])
+    quantities = _make_graphs(
+        QuantityGraph,
+        values,
+        key="test",
+        unit="mm",
+        iri="https://example.org/test",
+    )
+    assert [model.value for model in quantities] == [1.5, 2.5, 3.5]
+    assert all(type(model.value) is float for model in quantities)
+    assert quantities[1].measurement_unit is quantities[0].measurement_unit
+
+
+@pytest.mark.parametrize("full_validation", [False, True])
+def test_make_graph_templates(full_validation):
+    from data2rdf import QuantityGraph
+    from data2rdf.config import Config
+    from data2rdf.diagnostics import Diagnostics
+    from data2rdf.models.graph import _make_graph
+
+    config = Config(full_validation=full_validation)
+    templates = {}
+    models = [
+        _make_graph(
+            QuantityGraph,
+            templates,
+            key=key,
+            unit="mm",
+            iri=f"https://example.org/{key} ",
+            config=config,
+        )
+        for key in ["Width", "Length"]
+    ]
+    expected = [
+        QuantityGraph(
+            key=key,
+            unit="mm",
+            iri=f"https://example.org/{key}",
+            config=config,
+        )
+        for key in ["Width", "Length"]
+    ]
+    assert [model.model_dump() for model in models] == [
+        model.model_dump() for model in expected
+    ]
+    assert [model.suffix for model in models] == ["Width", "Length"]
+
+    diagnostics = Diagnostics(mode="collect")
+    with diagnostics.activate():
+        for key in ["Width", "Length"]:
+            _make_graph(
+                QuantityGraph,
+                templates,
+                key=key,
+                unit="foo",
+                iri=f"https://example.org/{key}",
+                config=config,
+            )
+    assert diagnostics.summary()["QUDTMappingWarning"] == {
+        "foo": {"Width": 1, "Length": 1}
+    }
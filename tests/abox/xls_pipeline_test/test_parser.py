@@ -385,3 +385,229 @@ def test_parser_excel_inputs(input_kind) -> None:
         metadata
     )
     assert sort_entries(parser.to_dict()) == as_non_dsms_schema(metadata)
+
+
+def test_parser_excel_read_only() -> None:
+    from data2rdf.parsers import ExcelParser
+    from data2rdf.warnings import MappingMissmatchWarning
+
+    mapping = os.path.join(mapping_folder, "tensile_test_mapping.json")
+    parsers = []
+    for read_only in [False, True]:
+        with pytest.warns(
+            MappingMissmatchWarning, match="Concept with key `Bemerkungen`"
+        ):
+            parser = ExcelParser(
+                raw_data=raw_data,
+                mapping=mapping,
+                parser_args={
+                    "unit_from_macro": True,
+                    "dropna": True,
+                    "read_only": read_only,
+                },
+            )
+        parsers.append(parser)
+    full, read_only = parsers
+
+    assert read_only.graph.isomorphic(full.graph)
+    assert read_only.dataframe.equals(full.dataframe)
+    assert remove_ids(read_only.to_dict(schema=dsms_schema)) == sort_entries(
+        metadata
+    )
+
+
+@pytest.mark.parametrize("read_only", [False, True])
+def test_parser_excel_unused_sheets(tmp_path, read_only) -> None:
+    import zipfile
+
+    from rdflib import Graph
+
+    from data2rdf.parsers import ExcelParser
+    from data2rdf.warnings import MappingMissmatchWarning
+
+    # the sheet `Auswertung` is not referenced by the mapping and is
+    # replaced by invalid xml, which would fail if it was parsed
+    path = tmp_path / "unused_sheets.xlsm"
+    with zipfile.ZipFile(raw_data) as source, zipfile.ZipFile(
+        path, "w"
+    ) as target:
+        for item in source.infolist():
+            content = source.read(item)
+            if item.filename == "xl/worksheets/sheet3.xml":
+                content = b"<worksheet>"
+            target.writestr(item, content)
+
+    with pytest.warns(
+        MappingMissmatchWarning, match="Concept with key `Bemerkungen`"
+    ):
+        parser = ExcelParser(
+            raw_data=str(path),
+            mapping=os.path.join(mapping_folder, "tensile_test_mapping.json"),
+            parser_args={
+                "unit_from_macro": True,
+                "dropna": True,
+                "read_only": read_only,
+            },
+        )
+
+    expected_graph = Graph()
+    expected_graph.parse(expected)
+
+    assert parser.graph.isomorphic(expected_graph)
+
+
+@pytest.mark.parametrize("read_only", [False, True])
+def test_parser_excel_dataframe_columns(tmp_path, read_only) -> None:
+    from openpyxl import Workbook
+    from openpyxl.styles import Font
+
+    from data2rdf.parsers import ExcelParser
+
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = "Data"
+    for row, values in enumerate(
+        [(1, 0.5, "a"), (2, None, "b"), (3, 1.5, None), (4, None, None)],
+        start=2,
+    ):
+        for column, value in enumerate(values, start=1):
+            worksheet.cell(row=row, column=column, value=value)
+    # formatted but empty cells far below the data
+    worksheet.cell(row=1000, column=1).font = Font(bold=True)
+    path = tmp_path / "columns.xlsx"
+    workbook.save(path)
+
+    mapping = [
+        {
+            "key": key,
+            "iri": f"https://example.org/{key}",
+            "worksheet": "Data",
+            "dataframe_start": f"{column}2",
+        }
+        for key, column in [("Count", "A"), ("Ratio", "B"), ("Label", "C")]
+    ]
+    parser = ExcelParser(
+        raw_data=str(path),
+        mapping=mapping,
+        parser_args={"dropna": False, "read_only": read_only},
+    )
+
+    dataframe = parser.dataframe
+    assert len(dataframe) == 4
+    assert dataframe["Count"].dtype == "int64"
+    assert dataframe["Count"].tolist() == [1, 2, 3, 4]
+    assert dataframe["Ratio"].dtype == "float64"
+    assert dataframe["Ratio"].isna().tolist() == [False, True, False, True]
+    assert dataframe["Label"].tolist() == ["a", "b", None, None]
+
+
+def test_parser_excel_max_workers() -> None:
+    from data2rdf.parsers import ExcelParser
+    from data2rdf.warnings import MappingMissmatchWarning
+
+    mapping = os.path.join(mapping_folder, "tensile_test_mapping.json")
+    parsers = []
+    for max_workers in [1, 2]:
+        with pytest.warns(
+            MappingMissmatchWarning, match="Concept with key `Bemerkungen`"
+        ):
+            parser = ExcelParser(
+                raw_data=raw_data,
+                mapping=mapping,
+                parser_args={
+                    "unit_from_macro": True,
+                    "dropna": True,
+                    "max_workers": max_workers,
+                },
+            )
+        parsers.append(parser)
+    sequential, parallel = parsers
+
+    assert parallel.graph.isomorphic(sequential.graph)
+    assert parallel.dataframe.equals(sequential.dataframe)
+    assert list(parallel.dataframe.columns) == list(
+        sequential.dataframe.columns
+    )
+    assert parallel.to_dict() == sequential.to_dict()
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "calamine"])
+def test_parser_excel_engine(engine) -> None:
+    from importlib.util import find_spec
+
+    import pandas as pd
+
+    from data2rdf.parsers import ExcelParser
+
+    mapping = os.path.join(mapping_folder, "tensile_test_mapping.json")
+    parser = ExcelParser(
+        raw_data=raw_data,
+        mapping=mapping,
+        parser_args={"dropna": True, "engine": engine},
+        config={"diagnostics": "collect"},
+    )
+    default = ExcelParser(
+        raw_data=raw_data,
+        mapping=mapping,
+        parser_args={"dropna": True},
+        config={"diagnostics": "collect"},
+    )
+
+    assert parser.graph.isomorphic(default.graph)
+    pd.testing.assert_frame_equal(parser.dataframe, default.dataframe)
+
+    summary = parser.diagnostics.summary()
+    if engine == "calamine" and find_spec("python_calamine") is None:
+        assert summary["ParserWarning"] == {"engine": {None: 1}}
+    else:
+        assert "ParserWarning" not in summary
+
+
+def test_parser_excel_xlsb() -> None:
+    pytest.importorskip("python_calamine")
+
+    import pandas as pd
+
+    from data2rdf.parsers import ExcelParser
+
+    mapping = os.path.join(mapping_folder, "tensile_test_mapping.json")
+    parser = ExcelParser(
+        raw_data=os.path.join(working_folder, "data", "AFZ1-Fz-S1Q.xlsb"),
+        mapping=mapping,
+        parser_args={"dropna": True, "engine": "calamine"},
+        config={"diagnostics": "collect"},
+    )
+    default = ExcelParser(
+        raw_data=raw_data,
+        mapping=mapping,
+        parser_args={"dropna": True},
+        config={"diagnostics": "collect"},
+    )
+
+    assert parser.graph.isomorphic(default.graph)
+    pd.testing.assert_frame_equal(parser.dataframe, default.dataframe)
+    assert "ParserWarning" not in parser.diagnostics.summary()
+
+
+def test_parser_excel_engine_unit_from_macro() -> None:
+    from rdflib import Graph
+
+    from data2rdf.parsers import ExcelParser
+
+    parser = ExcelParser(
+        raw_data=raw_data,
+        mapping=os.path.join(mapping_folder, "tensile_test_mapping.json"),
+        parser_args={
+            "unit_from_macro": True,
+            "dropna": True,
+            "engine": "calamine",
+        },
+        config={"diagnostics": "collect"},
+    )
+
+    expected_graph = Graph()
+    expected_graph.parse(expected)
+
+    assert parser.graph.isomorphic(expected_graph)
+    summary = parser.diagnostics.summary()
+    assert summary["ParserWarning"] == {"engine": {None: 1}}
@@ -105,3 +105,99 @@ def test_parser_excel_inputs_tbox(input_kind) -> None:
     expected_graph.parse(expected)
 
     assert parser.graph.isomorphic(expected_graph)
+
+
+@pytest.mark.parametrize("engine", [None, "openpyxl", "calamine"])
+def test_parser_excel_engine_tbox(engine) -> None:
+    from importlib.util import find_spec
+
+    from rdflib import Graph
+
+    from data2rdf.parsers import ExcelParser
+
+    parser = ExcelParser(
+        mode="tbox",
+        raw_data=raw_data,
+        mapping=os.path.join(mapping_folder, "mapping.json"),
+        parser_args={
+            "sheet": "Sheet1",
+            "suffix_location": "Ontological concept ID",
+            "ontology_title": "Test Ontology",
+            "authors": ["Jane Doe"],
+            "version_info": "1.0.0",
+            "engine": engine,
+        },
+        config={
+            "base_iri": "https://w3id.org/dimat",
+            "diagnostics": "collect",
+        },
+    )
+
+    expected_graph = Graph()
+    expected_graph.parse(expected)
+
+    assert parser.graph.isomorphic(expected_graph)
+
+    summary = parser.diagnostics.summary()
+    if engine == "calamine" and find_spec("python_calamine") is None:
+        assert summary["ParserWarning"] == {"engine": {None: 1}}
+    else:
+        assert "ParserWarning" not in summary
+
+
+def test_parser_excel_ods_tbox_default_engine() -> None:
+    pytest.importorskip("odf")
+
+    from rdflib import Graph
+
+    from data2rdf.parsers import ExcelParser
+
+    parser = ExcelParser(
+        mode="tbox",
+        raw_data=os.path.join(working_folder, "data", "classes.ods"),
+        mapping=os.path.join(mapping_folder, "mapping.json"),
+        parser_args={
+            "sheet": "Sheet1",
+            "suffix_location": "Ontological concept ID",
+            "ontology_title": "Test Ontology",
+            "authors": ["Jane Doe"],
+            "version_info": "1.0.0",
+        },
+        config={"base_iri": "https://w3id.org/dimat"},
+    )
+
+    expected_graph = Graph()
+    expected_graph.parse(expected)
+
+    assert parser.graph.isomorphic(expected_graph)
+
+
+def test_parser_excel_ods_tbox() -> None:
+    pytest.importorskip("python_calamine")
+
+    from rdflib import Graph
+
+    from data2rdf.parsers import ExcelParser
+
+    parser = ExcelParser(
+        mode="tbox",
+        raw_data=os.path.join(working_folder, "data", "classes.ods"),
+        mapping=os.path.join(mapping_folder, "mapping.json"),
+        parser_args={
+            "sheet": "Sheet1",
+            "suffix_location": "Ontological concept ID",
+            "ontology_title": "Test Ontology",
+            "authors": ["Jane Doe"],
+            "version_info": "1.0.0",
+            "engine": "calamine",
+        },
+        config={
+            "base_iri": "https://w3id.org/dimat",
+            "diagnostics": "collect",
+        },
+    )
+
+    expected_graph = Graph()
+    expected_graph.parse(expected)
+
+    assert parser.graph.isomorphic(expected_graph)
@@ -0,0 +1,56 @@
+"""Test lazy imports of data2rdf"""
+
+import pytest
+
+HEAVY_MODULES = ["pandas", "numpy", "openpyxl", "jsonpath_ng", "requests"]
+
+
+def _loaded_modules(statement: str) -> list:
+    import json
+    import subprocess
+    import sys
+
+    code = f"""import json, sys
+{statement}
+print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))
+"""
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+@pytest.mark.parametrize(
+    "statement,expected",
+    [
+        ("import data2rdf", []),
+        ("from data2rdf import Data2RDF, Parser, QuantityGraph", []),
+        ("from data2rdf import Parser; Parser.csv.value.load()", ["pandas"]),
+        ("from data2rdf.parsers import JsonParser", ["jsonpath_ng"]),
+        ("from data2rdf.parsers import ExcelParser", ["openpyxl"]),
+    ],
+)
+def test_lazy_imports(statement, expected) -> None:
+    loaded = _loaded_modules(statement)
+    for name in expected:
+        assert name in loaded
+    for name in {"openpyxl", "jsonpath_ng"} - set(expected):
+        assert name not in loaded
+    if not expected:
+        assert loaded == []
+
+
+def test_parser_lookup() -> None:
+    from data2rdf import Parser
+    from data2rdf.parsers import CSVParser, ExcelParser, JsonParser
+
+    assert Parser(CSVParser) is Parser.csv
+    assert Parser(ExcelParser) is Parser.excel
+    assert Parser(JsonParser) is Parser.json
+    assert Parser["json"].value.load() is JsonParser
+
+    with pytest.raises(ValueError):
+        Parser(dict)
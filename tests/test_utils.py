@@ -20,3 +20,157 @@ def test_unit_retrieval(iri, symbol) -> None:
     config = Config()
 
     assert [iri] == _get_query_match(symbol, config.qudt_units)
+
+
+def test_unit_retrieval_from_file() -> None:
+    import os
+
+    from data2rdf.qudt.utils import _get_query_match
+
+    qudt_units = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "benchmarks",
+        "qudt_units.ttl",
+    )
+
+    assert _get_query_match("mm", qudt_units) == [
+        "http://qudt.org/vocab/unit/MilliM"
+    ]
+
+
+@pytest.mark.parametrize("to_be_removed", [['"', "\r", "\n"], ["ab", "."], []])
+def test_remove_from_dataframe(to_be_removed) -> None:
+    import numpy as np
+    import pandas as pd
+
+    from data2rdf.parsers.csv import _remove_from_dataframe, _replace
+
+    df = pd.DataFrame(
+        {
+            "text": ['"a"', "b\r\n", None, "x.ab.y"],
+            "mixed": ['"1"', 2, np.nan, 3.5],
+            "numbers": [1.0, 2.0, np.nan, 4.0],
+        }
+    )
+    expected = df.map(lambda value: _replace(value, to_be_removed))
+    result = _remove_from_dataframe(df.copy(), to_be_removed)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz", "zstd", None])
+def test_decompress(compression) -> None:
+    import bz2
+    import gzip
+    import lzma
+    from io import BufferedReader, BytesIO, StringIO
+
+    from data2rdf.parsers.utils import _decompress
+
+    content = b'{"foo": "bar"}'
+    if compression == "zstd":
+        zstandard = pytest.importorskip("zstandard")
+        compressed = zstandard.ZstdCompressor().compress(content)
+    else:
+        compress = {"gzip": gzip, "bz2": bz2, "xz": lzma}.get(compression)
+        compressed = compress.compress(content) if compress else content
+
+    assert _decompress(BytesIO(compressed)).read() == content
+    assert _decompress(BufferedReader(BytesIO(compressed))).read() == content
+    assert _decompress(BytesIO(compressed)).readline() == content
+
+    text = StringIO(content.decode())
+    assert _decompress(text) is text
+
+
+@pytest.mark.parametrize("content", [b"", b"BZh", b"BZh9 is no bz2\n"])
+def test_decompress_bz2_signature(content) -> None:
+    import bz2
+    from io import BytesIO
+
+    from data2rdf.parsers.utils import _decompress
+
+    stream = BytesIO(content)
+    assert _decompress(stream) is stream
+    assert _decompress(BytesIO(bz2.compress(content))).read() == content
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "$",
+        "$.metadata.name",
+        "metadata.name",
+        "$.data[0].x",
+        "$.data[5].x",
+        "$.data[*].x",
+        "$.data[*]",
+        "$.metadata.*",
+        "$.metadata.name[*]",
+        "$.metadata.missing",
+        "$.matrix[1][0]",
+        "$.matrix[*][*]",
+        '"$"."key with space"',
+        '"key with space"."x"',
+        "$.data..x",
+        "$.data[0:2].x",
+    ],
+)
+def test_simple_jsonpath(expression) -> None:
+    from jsonpath_ng import parse
+
+    from data2rdf.parsers.utils import (  # isort:skip
+        _compile_simple_jsonpath,
+        _find_simple_jsonpath,
+    )
+
+    data = {
+        "metadata": {"name": "foo", "count": 3, "empty": None},
+        "data": [{"x": 1}, {"x": 2}, {"y": 3}],
+        "matrix": [[1, 2], [3, 4]],
+        "key with space": {"x": 1.5},
+    }
+    expected = [match.value for match in parse(expression).find(data)]
+
+    steps = _compile_simple_jsonpath(expression)
+    if ".." in expression or ":" in expression:
+        assert steps is None
+    else:
+        assert _find_simple_jsonpath(steps, data) == expected
+
+
+def test_simple_jsonpaths() -> None:
+    from data2rdf.parsers.utils import (
+        _compile_simple_jsonpath,
+        _find_simple_jsonpath,
+        _find_simple_jsonpaths,
+        _make_jsonpath_trie,
+    )
+
+    data = {
+        "metadata": {"name": "foo", "count": 3},
+        "data": [{"x": 1}, {"x": 2}, {"y": 3}],
+    }
+    expressions = (
+        "$",
+        "$.metadata.name",
+        "metadata.name",
+        "$.metadata.count",
+        "$.data[*].x",
+        "$.data[0].x",
+        "$.data[*]",
+        "$.missing.name",
+    )
+    # indexing a number fails and is left to the single evaluation,
+    # while recursive descents are not part of the simple subset
+    failing = "$.metadata.count[0]"
+    recursive = "$..x"
+
+    trie = _make_jsonpath_trie((*expressions, failing, recursive))
+    results = _find_simple_jsonpaths(trie, data)
+
+    assert failing not in results
+    assert recursive not in results
+    for expression in expressions:
+        steps = _compile_simple_jsonpath(expression)
+        assert results[expression] == _find_simple_jsonpath(steps, data)